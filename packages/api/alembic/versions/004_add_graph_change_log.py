@@ -0,0 +1,45 @@
+"""add graph change log
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'projects',
+        sa.Column('compacted_revision', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.create_table(
+        'graph_changes',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('project_id', sa.String(), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(), nullable=False),
+        sa.Column('entity_id', sa.String(), nullable=False),
+        sa.Column('op', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_graph_changes_project_revision',
+        'graph_changes',
+        ['project_id', 'revision']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_graph_changes_project_revision', table_name='graph_changes')
+    op.drop_table('graph_changes')
+    op.drop_column('projects', 'compacted_revision')
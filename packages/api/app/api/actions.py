@@ -11,7 +11,9 @@ from app.models.action_history import ActionHistory
 from app.schemas.action import (
     SiblingActionResponse,
     ActionExecutionRequest,
-    ActionExecutionResult
+    ActionExecutionResult,
+    BatchActionsRequest,
+    BatchActionsResponse
 )
 from app.services.context_detector import context_detector
 from app.services.action_registry import action_registry
@@ -53,6 +55,50 @@ def get_node_actions(
     return actions
 
 
+@router.post(
+    "/actions/batch",
+    response_model=BatchActionsResponse,
+    summary="Get available actions for many nodes"
+)
+def get_batch_node_actions(
+    project_id: str,
+    request: BatchActionsRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Resolve available sibling actions for every node in a project,
+    or for the given node IDs, in a single request.
+    Actions are computed once per distinct (type, status) context.
+    """
+    # Verify project exists
+    project = db.query(Project.id).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    # Read all requested nodes in one query
+    query = db.query(Node.id, Node.type, Node.status).filter(
+        Node.project_id == project_id
+    )
+    if request.node_ids is not None:
+        query = query.filter(Node.id.in_(request.node_ids))
+    rows = query.all()
+
+    contexts, node_contexts = context_detector.detect_actions_for_nodes(rows)
+
+    missing = []
+    if request.node_ids is not None:
+        missing = [
+            node_id for node_id in dict.fromkeys(request.node_ids)
+            if node_id not in node_contexts
+        ]
+
+    return BatchActionsResponse(
+        contexts=contexts,
+        nodes=node_contexts,
+        missing=missing
+    )
+
+
 @router.get(
     "/{node_id}/actions/{group_id}/expand",
     response_model=List[SiblingActionResponse],
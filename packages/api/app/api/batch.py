@@ -0,0 +1,152 @@
+"""
+API endpoint for applying many graph mutations in one transaction.
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from typing import List, Tuple
+from app.db.base import get_db
+from app.models.project import Project
+from app.models.node import Node
+from app.models.edge import Edge
+from app.models.milestone import Milestone
+from app.schemas.node import NodeCreate, NodeUpdate
+from app.schemas.edge import EdgeCreate, EdgeUpdate
+from app.schemas.milestone import MilestoneCreate, MilestoneUpdate
+from app.schemas.batch import (
+    BatchOperation,
+    BatchOperationResult,
+    BatchRequest,
+    BatchResponse
+)
+from app.services.change_log import record_changes
+from app.services.graph_cache import graph_cache
+from app.services.graph_rows import (
+    node_row,
+    node_update_values,
+    edge_row,
+    edge_update_values,
+    milestone_row,
+    milestone_update_values
+)
+from app.api.events import broadcast_changes
+
+router = APIRouter()
+
+MODELS = {"node": Node, "edge": Edge, "milestone": Milestone}
+
+
+class BatchOperationError(Exception):
+    """Raised when a batch operation cannot be applied."""
+
+
+def _apply_operation(db: Session, project_id: str, operation: BatchOperation) -> Tuple[str, str]:
+    """Apply one operation. Returns the entity ID and the change-log op."""
+    model = MODELS[operation.entity]
+
+    if operation.op == "create":
+        if operation.id is not None and db.get(model, operation.id) is not None:
+            raise BatchOperationError(f"{operation.entity} {operation.id} already exists")
+        if operation.entity == "node":
+            row = node_row(project_id, NodeCreate(**operation.data), operation.id)
+        elif operation.entity == "edge":
+            row = edge_row(project_id, EdgeCreate(**operation.data), operation.id)
+        else:
+            row = milestone_row(project_id, MilestoneCreate(**operation.data), operation.id)
+        db.add(model(**row))
+        db.flush()
+        return row["id"], "insert"
+
+    if operation.id is None:
+        raise BatchOperationError(f"{operation.op} requires an id")
+    instance = db.get(model, operation.id)
+    if instance is None or instance.project_id != project_id:
+        raise BatchOperationError(f"{operation.entity.capitalize()} not found")
+
+    if operation.op == "delete":
+        db.delete(instance)
+        db.flush()
+        return operation.id, "delete"
+
+    if operation.entity == "node":
+        values = node_update_values(instance.metadata, NodeUpdate(**operation.data))
+    elif operation.entity == "edge":
+        values = edge_update_values(EdgeUpdate(**operation.data))
+    else:
+        values = milestone_update_values(MilestoneUpdate(**operation.data))
+    for key, value in values.items():
+        setattr(instance, key, value)
+    db.flush()
+    return operation.id, "update"
+
+
+@router.post(
+    "/{project_id}/batch",
+    response_model=BatchResponse,
+    summary="Apply a batch of graph mutations"
+)
+async def apply_batch(
+    project_id: str,
+    request: BatchRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Apply an ordered list of create/patch/delete operations on nodes,
+    edges and milestones in a single transaction with one commit.
+    If any operation fails, nothing is written and the per-operation
+    results are returned with a 422.
+    """
+    if db.query(Project.id).filter(Project.id == project_id).first() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    results: List[BatchOperationResult] = []
+    changes: List[Tuple[str, str, str]] = []
+
+    for index, operation in enumerate(request.operations):
+        try:
+            entity_id, change_op = _apply_operation(db, project_id, operation)
+        except (BatchOperationError, ValidationError, ValueError) as e:
+            db.rollback()
+            results.append(BatchOperationResult(
+                index=index,
+                op=operation.op,
+                entity=operation.entity,
+                id=operation.id,
+                status="error",
+                error=str(e)
+            ))
+            results.extend(
+                BatchOperationResult(
+                    index=skipped_index,
+                    op=skipped.op,
+                    entity=skipped.entity,
+                    id=skipped.id,
+                    status="skipped"
+                )
+                for skipped_index, skipped in enumerate(request.operations)
+                if skipped_index > index
+            )
+            raise HTTPException(
+                status_code=422,
+                detail={
+                    "message": f"Operation {index} failed; no changes were applied",
+                    "results": [result.model_dump() for result in results]
+                }
+            )
+
+        results.append(BatchOperationResult(
+            index=index,
+            op=operation.op,
+            entity=operation.entity,
+            id=entity_id,
+            status="ok"
+        ))
+        changes.append((operation.entity, entity_id, change_op))
+
+    revision = record_changes(db, project_id, changes)
+    db.commit()
+    graph_cache.invalidate(project_id)
+
+    await broadcast_changes(db, project_id, revision, changes, "batch")
+
+    return BatchResponse(revision=revision, results=results)
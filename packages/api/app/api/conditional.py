@@ -0,0 +1,62 @@
+"""
+Conditional GET helpers (ETag / Last-Modified) for project-scoped reads.
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Optional
+from fastapi.responses import Response
+from app.services.revisions import ProjectRevision
+
+
+def revision_etag(revision: ProjectRevision, view: str) -> str:
+    """Build the strong ETag for a view of a project at a revision."""
+    return f'"{revision.revision}-{view}"'
+
+
+def revision_headers(revision: ProjectRevision, view: str) -> Dict[str, str]:
+    """Build validator headers for a view of a project."""
+    headers = {
+        "ETag": revision_etag(revision, view),
+        "Cache-Control": "no-cache",
+    }
+    if revision.updated_at is not None:
+        headers["Last-Modified"] = _http_date(revision.updated_at)
+    return headers
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(
+    revision: Optional[ProjectRevision],
+    view: str,
+    if_none_match: Optional[str]
+) -> Optional[Response]:
+    """
+    Return a 304 response if the client already holds this revision,
+    otherwise None.
+    """
+    if revision is None:
+        return None
+    headers = revision_headers(revision, view)
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
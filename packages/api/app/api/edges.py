@@ -1,25 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.db.base import get_db
 from app.models.edge import Edge
 from app.schemas.edge import EdgeCreate, EdgeResponse
+from app.services.graph_cache import graph_cache
+from app.services.revisions import get_revision
+from app.services.change_log import record_change
+from app.api.conditional import not_modified, revision_headers
+from app.api.events import broadcast_changes
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[EdgeResponse])
-def list_edges(project_id: str, db: Session = Depends(get_db)):
+def list_edges(
+    project_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    revision = get_revision(db, project_id)
+    unchanged = not_modified(revision, "edges", if_none_match)
+    if unchanged is not None:
+        return unchanged
+
     edges = db.query(Edge).filter(Edge.project_id == project_id).all()
+    if revision is not None:
+        response.headers.update(revision_headers(revision, "edges"))
     return edges
 
 
 @router.post("/", response_model=EdgeResponse, status_code=201)
-def create_edge(project_id: str, edge: EdgeCreate, db: Session = Depends(get_db)):
+async def create_edge(project_id: str, edge: EdgeCreate, db: Session = Depends(get_db)):
     db_edge = Edge(**edge.dict(), project_id=project_id)
     db.add(db_edge)
+    db.flush()
+    revision = record_change(db, project_id, "edge", db_edge.id, "insert")
     db.commit()
+    graph_cache.invalidate(project_id)
     db.refresh(db_edge)
+    await broadcast_changes(
+        db, project_id, revision, [("edge", db_edge.id, "insert")], "edge_created"
+    )
     return db_edge
 
 
@@ -36,7 +59,7 @@ def get_edge(project_id: str, edge_id: str, db: Session = Depends(get_db)):
 
 
 @router.delete("/{edge_id}", status_code=204)
-def delete_edge(project_id: str, edge_id: str, db: Session = Depends(get_db)):
+async def delete_edge(project_id: str, edge_id: str, db: Session = Depends(get_db)):
     db_edge = (
         db.query(Edge)
         .filter(Edge.id == edge_id, Edge.project_id == project_id)
@@ -45,5 +68,10 @@ def delete_edge(project_id: str, edge_id: str, db: Session = Depends(get_db)):
     if not db_edge:
         raise HTTPException(status_code=404, detail="Edge not found")
     db.delete(db_edge)
+    revision = record_change(db, project_id, "edge", edge_id, "delete")
     db.commit()
+    graph_cache.invalidate(project_id)
+    await broadcast_changes(
+        db, project_id, revision, [("edge", edge_id, "delete")], "edge_deleted"
+    )
     return None
\ No newline at end of file
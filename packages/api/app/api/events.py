@@ -0,0 +1,42 @@
+"""
+Websocket notifications for committed graph writes.
+"""
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy.orm import Session
+from app.services.change_log import ENTITIES, ChangeSet
+from app.api.graph import build_graph_changes
+from app.api.websocket import manager
+
+
+async def broadcast_changes(
+    db: Session,
+    project_id: str,
+    revision: int,
+    changes: Iterable[Tuple[str, str, str]],
+    reason: str
+) -> None:
+    """
+    Announce the (entity, entity_id, op) changes committed under a
+    revision. Hint subscribers get the touched IDs; payload subscribers
+    also get the changed entities as a patch against revision - 1, in
+    the same shape as GET /graph/changes.
+    """
+    last_op: Dict[Tuple[str, str], str] = {}
+    for entity, entity_id, op in changes:
+        last_op[(entity, entity_id)] = op
+
+    touched: Dict[str, List[str]] = {f"{entity}s": [] for entity in ENTITIES}
+    upserted: Dict[str, List[str]] = {entity: [] for entity in ENTITIES}
+    deleted: Dict[str, List[str]] = {entity: [] for entity in ENTITIES}
+    for (entity, entity_id), op in last_op.items():
+        touched[f"{entity}s"].append(entity_id)
+        (deleted if op == "delete" else upserted)[entity].append(entity_id)
+
+    patch = build_graph_changes(
+        db, project_id, revision - 1, ChangeSet(revision=revision, upserted=upserted, deleted=deleted)
+    )
+    await manager.broadcast(project_id, {
+        "type": "graph_changed",
+        "data": {"reason": reason, "revision": revision, **touched},
+        "patch": patch.model_dump(mode="json"),
+    })
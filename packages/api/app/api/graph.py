@@ -1,12 +1,23 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from app.config import settings
 from app.db.base import get_db
 from app.models.node import Node
 from app.models.edge import Edge
-from app.schemas.node import NodeResponse
-from app.schemas.edge import EdgeResponse
-from pydantic import BaseModel
+from app.models.milestone import Milestone
+from app.models.project import Project
+from app.schemas.node import NodeCreate, NodeResponse
+from app.schemas.edge import EdgeCreate, EdgeResponse
+from app.schemas.milestone import MilestoneResponse
+from app.services.graph_cache import graph_cache
+from app.services.revisions import get_revision
+from app.services.change_log import ChangeSet, changes_since, reset_changes
+from app.services.bulk_import import bulk_insert
+from app.services.graph_rows import node_row, edge_row
+from app.api.conditional import not_modified, revision_headers
+from pydantic import BaseModel, Field
 
 router = APIRouter()
 
@@ -16,8 +27,143 @@ class GraphResponse(BaseModel):
     edges: List[EdgeResponse]
 
 
+class BulkNodeCreate(NodeCreate):
+    id: Optional[str] = None
+
+
+class BulkEdgeCreate(EdgeCreate):
+    id: Optional[str] = None
+
+
+class BulkGraphImport(BaseModel):
+    nodes: List[BulkNodeCreate] = []
+    edges: List[BulkEdgeCreate] = []
+    batch_size: Optional[int] = Field(None, ge=1, le=100000)
+
+
+class BulkGraphImportResult(BaseModel):
+    nodes: int
+    edges: int
+    revision: int
+
+
+class NodeChanges(BaseModel):
+    upserted: List[NodeResponse] = []
+    deleted: List[str] = []
+
+
+class EdgeChanges(BaseModel):
+    upserted: List[EdgeResponse] = []
+    deleted: List[str] = []
+
+
+class MilestoneChanges(BaseModel):
+    upserted: List[MilestoneResponse] = []
+    deleted: List[str] = []
+
+
+class GraphChangesResponse(BaseModel):
+    revision: int
+    since: int
+    reset: bool = False  # True when the client must reload the full graph
+    nodes: NodeChanges = NodeChanges()
+    edges: EdgeChanges = EdgeChanges()
+    milestones: MilestoneChanges = MilestoneChanges()
+
+
 @router.get("/{project_id}/graph", response_model=GraphResponse)
-def get_graph(project_id: str, db: Session = Depends(get_db)):
-    nodes = db.query(Node).filter(Node.project_id == project_id).all()
-    edges = db.query(Edge).filter(Edge.project_id == project_id).all()
-    return {"nodes": nodes, "edges": edges}
\ No newline at end of file
+def get_graph(
+    project_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    revision = get_revision(db, project_id)
+    unchanged = not_modified(revision, "graph", if_none_match)
+    if unchanged is not None:
+        return unchanged
+
+    view = f"graph@{revision.revision}" if revision else "graph"
+    body = graph_cache.get(project_id, view)
+    if body is None:
+        nodes = db.query(Node).filter(Node.project_id == project_id).all()
+        edges = db.query(Edge).filter(Edge.project_id == project_id).all()
+        graph = GraphResponse.model_validate({"nodes": nodes, "edges": edges}, from_attributes=True)
+        body = graph.model_dump_json().encode()
+        graph_cache.put(project_id, view, body)
+
+    headers = revision_headers(revision, "graph") if revision else {}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/{project_id}/graph/changes", response_model=GraphChangesResponse)
+def get_graph_changes(
+    project_id: str,
+    since: int = Query(..., ge=0),
+    db: Session = Depends(get_db),
+):
+    revision = get_revision(db, project_id)
+    if revision is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    change_set = changes_since(db, project_id, since)
+    if change_set is None:
+        return GraphChangesResponse(revision=revision.revision, since=since, reset=True)
+    return build_graph_changes(db, project_id, since, change_set)
+
+
+def build_graph_changes(
+    db: Session,
+    project_id: str,
+    since: int,
+    change_set: ChangeSet
+) -> GraphChangesResponse:
+    """Load the upserted entities of a change set into a response."""
+    def load(model, ids):
+        if not ids:
+            return []
+        return db.query(model).filter(model.project_id == project_id, model.id.in_(ids)).all()
+
+    nodes = load(Node, change_set.upserted["node"])
+    edges = load(Edge, change_set.upserted["edge"])
+    milestones = load(Milestone, change_set.upserted["milestone"])
+
+    return GraphChangesResponse.model_validate(
+        {
+            "revision": change_set.revision,
+            "since": since,
+            "nodes": {"upserted": nodes, "deleted": change_set.deleted["node"]},
+            "edges": {"upserted": edges, "deleted": change_set.deleted["edge"]},
+            "milestones": {"upserted": milestones, "deleted": change_set.deleted["milestone"]},
+        },
+        from_attributes=True,
+    )
+
+
+@router.post(
+    "/{project_id}/graph:bulk",
+    response_model=BulkGraphImportResult,
+    status_code=201,
+)
+def bulk_import_graph(
+    project_id: str,
+    payload: BulkGraphImport,
+    db: Session = Depends(get_db),
+):
+    """
+    Append many nodes and edges in batched inserts (COPY on PostgreSQL)
+    within a single transaction. Delta sync clients are reset to a full
+    reload, since individual rows are not logged.
+    """
+    if db.query(Project.id).filter(Project.id == project_id).first() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    batch_size = payload.batch_size or settings.BULK_INSERT_BATCH_SIZE
+    node_rows = (node_row(project_id, node, node.id) for node in payload.nodes)
+    edge_rows = (edge_row(project_id, edge, edge.id) for edge in payload.edges)
+    node_count = bulk_insert(db, Node.__table__, node_rows, batch_size)
+    edge_count = bulk_insert(db, Edge.__table__, edge_rows, batch_size)
+    revision = reset_changes(db, project_id)
+    db.commit()
+    graph_cache.invalidate(project_id)
+
+    return BulkGraphImportResult(nodes=node_count, edges=edge_count, revision=revision)
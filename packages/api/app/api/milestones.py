@@ -1,27 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.db.base import get_db
 from app.models.milestone import Milestone
 from app.schemas.milestone import MilestoneCreate, MilestoneUpdate, MilestoneResponse
+from app.services.graph_cache import graph_cache
+from app.services.revisions import get_revision
+from app.services.change_log import record_change
+from app.api.conditional import not_modified, revision_headers
+from app.api.events import broadcast_changes
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[MilestoneResponse])
-def list_milestones(project_id: str, db: Session = Depends(get_db)):
+def list_milestones(
+    project_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    revision = get_revision(db, project_id)
+    unchanged = not_modified(revision, "milestones", if_none_match)
+    if unchanged is not None:
+        return unchanged
+
     milestones = db.query(Milestone).filter(Milestone.project_id == project_id).all()
+    if revision is not None:
+        response.headers.update(revision_headers(revision, "milestones"))
     return milestones
 
 
 @router.post("/", response_model=MilestoneResponse, status_code=201)
-def create_milestone(
+async def create_milestone(
     project_id: str, milestone: MilestoneCreate, db: Session = Depends(get_db)
 ):
     db_milestone = Milestone(**milestone.dict(), project_id=project_id)
     db.add(db_milestone)
+    db.flush()
+    revision = record_change(db, project_id, "milestone", db_milestone.id, "insert")
     db.commit()
+    graph_cache.invalidate(project_id)
     db.refresh(db_milestone)
+    await broadcast_changes(
+        db, project_id, revision, [("milestone", db_milestone.id, "insert")], "milestone_created"
+    )
     return db_milestone
 
 
@@ -38,7 +61,7 @@ def get_milestone(project_id: str, milestone_id: str, db: Session = Depends(get_
 
 
 @router.patch("/{milestone_id}", response_model=MilestoneResponse)
-def update_milestone(
+async def update_milestone(
     project_id: str,
     milestone_id: str,
     milestone_update: MilestoneUpdate,
@@ -56,13 +79,18 @@ def update_milestone(
     for key, value in update_data.items():
         setattr(milestone, key, value)
 
+    revision = record_change(db, project_id, "milestone", milestone_id, "update")
     db.commit()
+    graph_cache.invalidate(project_id)
     db.refresh(milestone)
+    await broadcast_changes(
+        db, project_id, revision, [("milestone", milestone_id, "update")], "milestone_updated"
+    )
     return milestone
 
 
 @router.delete("/{milestone_id}", status_code=204)
-def delete_milestone(project_id: str, milestone_id: str, db: Session = Depends(get_db)):
+async def delete_milestone(project_id: str, milestone_id: str, db: Session = Depends(get_db)):
     milestone = (
         db.query(Milestone)
         .filter(Milestone.id == milestone_id, Milestone.project_id == project_id)
@@ -71,5 +99,10 @@ def delete_milestone(project_id: str, milestone_id: str, db: Session = Depends(g
     if not milestone:
         raise HTTPException(status_code=404, detail="Milestone not found")
     db.delete(milestone)
+    revision = record_change(db, project_id, "milestone", milestone_id, "delete")
     db.commit()
+    graph_cache.invalidate(project_id)
+    await broadcast_changes(
+        db, project_id, revision, [("milestone", milestone_id, "delete")], "milestone_deleted"
+    )
     return None
\ No newline at end of file
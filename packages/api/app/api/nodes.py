@@ -1,25 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.db.base import get_db
 from app.models.node import Node
 from app.schemas.node import NodeCreate, NodeUpdate, NodeResponse
+from app.services.graph_cache import graph_cache
+from app.services.revisions import get_revision
+from app.services.change_log import record_change
+from app.api.conditional import not_modified, revision_headers
+from app.api.events import broadcast_changes
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[NodeResponse])
-def list_nodes(project_id: str, db: Session = Depends(get_db)):
+def list_nodes(
+    project_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    revision = get_revision(db, project_id)
+    unchanged = not_modified(revision, "nodes", if_none_match)
+    if unchanged is not None:
+        return unchanged
+
     nodes = db.query(Node).filter(Node.project_id == project_id).all()
+    if revision is not None:
+        response.headers.update(revision_headers(revision, "nodes"))
     return nodes
 
 
 @router.post("/", response_model=NodeResponse, status_code=201)
-def create_node(project_id: str, node: NodeCreate, db: Session = Depends(get_db)):
+async def create_node(project_id: str, node: NodeCreate, db: Session = Depends(get_db)):
     db_node = Node(**node.dict(), project_id=project_id)
     db.add(db_node)
+    db.flush()
+    revision = record_change(db, project_id, "node", db_node.id, "insert")
     db.commit()
+    graph_cache.invalidate(project_id)
     db.refresh(db_node)
+    await broadcast_changes(
+        db, project_id, revision, [("node", db_node.id, "insert")], "node_created"
+    )
     return db_node
 
 
@@ -36,7 +59,7 @@ def get_node(project_id: str, node_id: str, db: Session = Depends(get_db)):
 
 
 @router.patch("/{node_id}", response_model=NodeResponse)
-def update_node(
+async def update_node(
     project_id: str,
     node_id: str,
     node_update: NodeUpdate,
@@ -54,13 +77,18 @@ def update_node(
     for key, value in update_data.items():
         setattr(db_node, key, value)
 
+    revision = record_change(db, project_id, "node", node_id, "update")
     db.commit()
+    graph_cache.invalidate(project_id)
     db.refresh(db_node)
+    await broadcast_changes(
+        db, project_id, revision, [("node", node_id, "update")], "node_updated"
+    )
     return db_node
 
 
 @router.delete("/{node_id}", status_code=204)
-def delete_node(project_id: str, node_id: str, db: Session = Depends(get_db)):
+async def delete_node(project_id: str, node_id: str, db: Session = Depends(get_db)):
     db_node = (
         db.query(Node)
         .filter(Node.id == node_id, Node.project_id == project_id)
@@ -69,5 +97,10 @@ def delete_node(project_id: str, node_id: str, db: Session = Depends(get_db)):
     if not db_node:
         raise HTTPException(status_code=404, detail="Node not found")
     db.delete(db_node)
+    revision = record_change(db, project_id, "node", node_id, "delete")
     db.commit()
+    graph_cache.invalidate(project_id)
+    await broadcast_changes(
+        db, project_id, revision, [("node", node_id, "delete")], "node_deleted"
+    )
     return None
\ No newline at end of file
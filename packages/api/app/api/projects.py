@@ -4,6 +4,8 @@ from typing import List
 from app.db.base import get_db
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.services.graph_cache import graph_cache
+from app.services.revisions import bump_revision
 
 router = APIRouter()
 
@@ -43,7 +45,9 @@ def update_project(
     for key, value in update_data.items():
         setattr(project, key, value)
 
+    bump_revision(db, project_id)
     db.commit()
+    graph_cache.invalidate(project_id)
     db.refresh(project)
     return project
 
@@ -55,4 +59,5 @@ def delete_project(project_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Project not found")
     db.delete(project)
     db.commit()
+    graph_cache.invalidate(project_id)
     return None
\ No newline at end of file
@@ -1,46 +1,97 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from typing import Dict, Set
-import json
+from app.config import settings
+from app.services.pubsub import bus
+from app.services.ws_outbox import ConnectionOutbox, SlowConsumerPolicy, queue_stats
 
 router = APIRouter()
 
+# hint: graph_changed carries touched IDs only; payload: graph_patch carries the entities
+SUBSCRIPTION_MODES = ("hint", "payload")
+
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self.active_connections: Dict[str, Dict[WebSocket, ConnectionOutbox]] = {}
+        self.payload_subscribers: Set[WebSocket] = set()
 
-    async def connect(self, websocket: WebSocket, project_id: str):
+    async def connect(self, websocket: WebSocket, project_id: str, mode: str = "hint"):
         await websocket.accept()
+        outbox = ConnectionOutbox(
+            websocket,
+            max_size=settings.WS_SEND_QUEUE_SIZE,
+            policy=SlowConsumerPolicy(settings.WS_SLOW_CONSUMER_POLICY),
+            resync_message={"type": "graph_changed", "data": {"reason": "resync"}},
+        )
+        outbox.start()
         if project_id not in self.active_connections:
-            self.active_connections[project_id] = set()
-        self.active_connections[project_id].add(websocket)
+            self.active_connections[project_id] = {}
+        self.active_connections[project_id][websocket] = outbox
+        if mode == "payload":
+            self.payload_subscribers.add(websocket)
 
-    def disconnect(self, websocket: WebSocket, project_id: str):
+    async def disconnect(self, websocket: WebSocket, project_id: str):
+        self.payload_subscribers.discard(websocket)
         if project_id in self.active_connections:
-            self.active_connections[project_id].discard(websocket)
+            outbox = self.active_connections[project_id].pop(websocket, None)
+            if outbox is not None:
+                await outbox.close()
+
+    def send(self, websocket: WebSocket, project_id: str, message: dict) -> bool:
+        """Queue a message for one connection."""
+        outbox = self.active_connections.get(project_id, {}).get(websocket)
+        return outbox.enqueue(message) if outbox is not None else False
 
     async def broadcast(self, project_id: str, message: dict):
+        # Reaches connections on every worker through the bus
+        await bus.publish("api", project_id, message)
+
+    def fan_out(self, project_id: str, message: dict):
+        # A message with a patch goes out as graph_patch to payload
+        # subscribers and without the patch to everyone else
+        patch = message.get("patch")
+        if patch is not None:
+            hint = {key: value for key, value in message.items() if key != "patch"}
+            payload = {"type": "graph_patch", "data": patch}
+
+        # Non-blocking: each connection's writer task does the send
         if project_id in self.active_connections:
-            disconnected = set()
-            for connection in self.active_connections[project_id]:
-                try:
-                    await connection.send_json(message)
-                except:
-                    disconnected.add(connection)
-            # Clean up disconnected websockets
-            self.active_connections[project_id] -= disconnected
+            connections = self.active_connections[project_id]
+            for websocket, outbox in list(connections.items()):
+                if outbox.closed:
+                    # Clean up disconnected websockets
+                    connections.pop(websocket, None)
+                    self.payload_subscribers.discard(websocket)
+                elif patch is None:
+                    outbox.enqueue(message)
+                else:
+                    outbox.enqueue(payload if websocket in self.payload_subscribers else hint)
+
+    def stats(self) -> dict:
+        """Queue depth and drop counters across all connections."""
+        return queue_stats(
+            outbox
+            for connections in self.active_connections.values()
+            for outbox in connections.values()
+        )
 
 
 manager = ConnectionManager()
+bus.subscribe("api", manager.fan_out, {"type": "graph_changed", "data": {"reason": "resync"}})
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket, project_id: str):
-    await manager.connect(websocket, project_id)
+async def websocket_endpoint(websocket: WebSocket, project_id: str, mode: str = "hint"):
+    if mode not in SUBSCRIPTION_MODES:
+        await websocket.close(code=1008, reason=f"Unknown mode: {mode}")
+        return
+    await manager.connect(websocket, project_id, mode)
     try:
         while True:
             data = await websocket.receive_text()
             # Echo back for now (Phase 0 stub)
-            await websocket.send_json({"type": "echo", "data": data})
+            manager.send(websocket, project_id, {"type": "echo", "data": data})
     except WebSocketDisconnect:
-        manager.disconnect(websocket, project_id)
\ No newline at end of file
+        pass
+    finally:
+        await manager.disconnect(websocket, project_id)
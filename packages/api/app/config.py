@@ -9,6 +9,16 @@ class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./vislzr.db")
     GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
     CORS_ORIGINS: List[str] = ["http://localhost:5173", "http://localhost:3000"]
+    GRAPH_CACHE_MAX_BYTES: int = int(os.getenv("GRAPH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    CHANGE_LOG_RETENTION: int = int(os.getenv("CHANGE_LOG_RETENTION", "1000"))
+    BULK_INSERT_BATCH_SIZE: int = int(os.getenv("BULK_INSERT_BATCH_SIZE", "5000"))
+    WS_SEND_QUEUE_SIZE: int = int(os.getenv("WS_SEND_QUEUE_SIZE", "256"))
+    WS_SLOW_CONSUMER_POLICY: str = os.getenv("WS_SLOW_CONSUMER_POLICY", "drop_oldest")  # drop_oldest, coalesce, disconnect
+    BROADCAST_BACKEND: str = os.getenv("BROADCAST_BACKEND", "memory")  # memory, unix, postgres
+    BROADCAST_SOCKET_PATH: str = os.getenv("BROADCAST_SOCKET_PATH", "/tmp/vislzr-broadcast.sock")
+    BROADCAST_DSN: str = os.getenv("BROADCAST_DSN", "")  # defaults to DATABASE_URL
+    BROADCAST_CHANNEL: str = os.getenv("BROADCAST_CHANNEL", "vislzr_broadcast")
+    GRAPH_EVENT_COALESCE_MS: int = int(os.getenv("GRAPH_EVENT_COALESCE_MS", "100"))
 
     class Config:
         env_file = ".env"
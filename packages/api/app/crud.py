@@ -1,8 +1,8 @@
-from sqlmodel import Session, select, delete
+from sqlmodel import Session, select
 from .models import Project, Node, Edge, Milestone
 from .schemas import GraphData, ProjectIn
 
-def upsert_project(session: Session, p: ProjectIn):
+def upsert_project(session: Session, p: ProjectIn, commit: bool = True):
     proj = session.get(Project, p.id)
     if proj is None:
         proj = Project(id=p.id, name=p.name, description=p.description or None, created_at=p.createdAt, updated_at=p.updatedAt)
@@ -11,26 +11,86 @@ def upsert_project(session: Session, p: ProjectIn):
         proj.name = p.name
         proj.description = p.description or None
         proj.updated_at = p.updatedAt
-    session.commit()
+    if commit:
+        session.commit()
     return proj
 
+def _diff_rows(session: Session, stored: dict, incoming: dict, build, fields):
+    """Apply a keyed diff of incoming rows against stored rows. Returns counts."""
+    counts = {"inserted": 0, "updated": 0, "deleted": 0}
+    for key, row in stored.items():
+        if key not in incoming:
+            session.delete(row)
+            counts["deleted"] += 1
+    for key, values in incoming.items():
+        row = stored.get(key)
+        if row is None:
+            session.add(build(key, values))
+            counts["inserted"] += 1
+            continue
+        changed = False
+        for field in fields:
+            if getattr(row, field) != values[field]:
+                setattr(row, field, values[field])
+                changed = True
+        if changed:
+            session.add(row)
+            counts["updated"] += 1
+    return counts
+
 def replace_graph(session: Session, g: GraphData):
-    proj = upsert_project(session, g.project)
-    # Clear current graph
-    session.exec(delete(Node).where(Node.project_id == proj.id))
-    session.exec(delete(Edge).where(Edge.project_id == proj.id))
-    session.exec(delete(Milestone).where(Milestone.project_id == proj.id))
-    session.commit()
+    """
+    Make the stored graph match `g` by applying only the inserts, updates
+    and deletes needed, in a single transaction.
+    Returns the project and per-entity diff counts.
+    """
+    proj = upsert_project(session, g.project, commit=False)
+    pid = proj.id
 
-    for n in g.nodes:
-        session.add(Node(id=n.id, project_id=proj.id, label=n.label, status=n.status, priority=n.priority, progress=n.progress, tags=",".join(n.tags or [])))
-    for e in g.edges:
-        session.add(Edge(project_id=proj.id, source=e.source, target=e.target, kind=e.kind, weight=e.weight))
-    for m in (g.milestones or []):
-        session.add(Milestone(id=m.id, project_id=proj.id, title=m.title, date=m.date, status=m.status))
+    stored_nodes = {n.id: n for n in session.exec(select(Node).where(Node.project_id == pid)).all()}
+    incoming_nodes = {
+        n.id: {"label": n.label, "status": n.status, "priority": n.priority, "progress": n.progress, "tags": ",".join(n.tags or [])}
+        for n in g.nodes
+    }
+    node_counts = _diff_rows(
+        session, stored_nodes, incoming_nodes,
+        lambda key, v: Node(id=key, project_id=pid, **v),
+        ("label", "status", "priority", "progress", "tags"),
+    )
+
+    stored_edges = {}
+    duplicate_edges = 0
+    for e in session.exec(select(Edge).where(Edge.project_id == pid)).all():
+        if (e.source, e.target) in stored_edges:
+            # Duplicate edge between the same pair: drop the extra copy
+            session.delete(e)
+            duplicate_edges += 1
+        else:
+            stored_edges[(e.source, e.target)] = e
+    incoming_edges = {
+        (e.source, e.target): {"source": e.source, "target": e.target, "kind": e.kind, "weight": e.weight}
+        for e in g.edges
+    }
+    edge_counts = _diff_rows(
+        session, stored_edges, incoming_edges,
+        lambda key, v: Edge(project_id=pid, **v),
+        ("kind", "weight"),
+    )
+    edge_counts["deleted"] += duplicate_edges
+
+    stored_miles = {m.id: m for m in session.exec(select(Milestone).where(Milestone.project_id == pid)).all()}
+    incoming_miles = {
+        m.id: {"title": m.title, "date": m.date, "status": m.status}
+        for m in (g.milestones or [])
+    }
+    milestone_counts = _diff_rows(
+        session, stored_miles, incoming_miles,
+        lambda key, v: Milestone(id=key, project_id=pid, **v),
+        ("title", "date", "status"),
+    )
 
     session.commit()
-    return proj
+    return proj, {"nodes": node_counts, "edges": edge_counts, "milestones": milestone_counts}
 
 def get_graph(session: Session, project_id: str):
     proj = session.get(Project, project_id)
@@ -4,6 +4,7 @@ from .db import init_db
 from .routes import router
 from .ws import router as ws_router
 from .config import settings
+from .services.pubsub import bus
 
 app = FastAPI(title="Vislzr API")
 
@@ -19,5 +20,10 @@ app.include_router(router)
 app.include_router(ws_router)
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     init_db()
+    await bus.start()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await bus.stop()
@@ -2,5 +2,6 @@ from app.models.project import Project
 from app.models.node import Node
 from app.models.edge import Edge
 from app.models.milestone import Milestone
+from app.models.graph_change import GraphChange
 
-__all__ = ["Project", "Node", "Edge", "Milestone"]
\ No newline at end of file
+__all__ = ["Project", "Node", "Edge", "Milestone", "GraphChange"]
\ No newline at end of file
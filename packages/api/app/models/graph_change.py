@@ -0,0 +1,25 @@
+"""
+SQLAlchemy model for the per-project graph change log.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class GraphChange(Base):
+    __tablename__ = "graph_changes"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    revision = Column(Integer, nullable=False)  # project revision that made the change
+    entity = Column(String, nullable=False)  # node, edge, milestone
+    entity_id = Column(String, nullable=False)
+    op = Column(String, nullable=False)  # insert, update, delete
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_graph_changes_project_revision", "project_id", "revision"),
+    )
+
+    def __repr__(self):
+        return f"<GraphChange {self.project_id}@{self.revision} {self.op} {self.entity} {self.entity_id}>"
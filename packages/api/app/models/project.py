@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, Integer, DateTime
 from sqlalchemy.sql import func
 from app.db.base import Base
 import uuid
@@ -10,5 +10,7 @@ class Project(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
+    revision = Column(Integer, nullable=False, default=0, server_default="0")  # bumped on every graph write
+    compacted_revision = Column(Integer, nullable=False, default=0, server_default="0")  # oldest revision deltas are kept from
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
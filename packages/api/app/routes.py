@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sqlmodel import Session, select, delete
 from pydantic import BaseModel
 from typing import Optional, List
@@ -7,8 +7,10 @@ from .db import get_session
 from .models import Project, Node, Edge, Milestone
 from .schemas import ProjectIn, GraphData, NodeData, EdgeData, Milestone as MilestoneSchema
 from .crud import upsert_project, replace_graph, get_graph
-from .ws import broadcast
+from .ws import broadcast, ws_stats
 from .ai_service import get_ai_service
+from .services.graph_cache import graph_cache
+import json
 
 class NodePatch(BaseModel):
     label: Optional[str] = None
@@ -31,9 +33,18 @@ router = APIRouter()
 def health():
     return {"ok": True}
 
+@router.get("/health/cache")
+def cache_stats():
+    return graph_cache.stats()
+
+@router.get("/health/ws")
+def websocket_stats():
+    return ws_stats()
+
 @router.post("/projects", response_model=ProjectIn)
 def create_or_update_project(p: ProjectIn, session: Session = Depends(get_session)):
     upsert_project(session, p)
+    graph_cache.invalidate(p.id)
     return p
 
 @router.get("/projects")
@@ -58,27 +69,35 @@ def delete_project(pid: str, session: Session = Depends(get_session)):
     session.exec(delete(Milestone).where(Milestone.project_id == pid))
     session.delete(p)
     session.commit()
+    graph_cache.invalidate(pid)
     return {"ok": True}
 
 @router.get("/projects/{pid}/graph")
 def get_project_graph(pid: str, session: Session = Depends(get_session)):
+    body = graph_cache.get(pid, "legacy")
+    if body is not None:
+        return Response(content=body, media_type="application/json")
     proj, nodes, edges, miles = get_graph(session, pid)
     if not proj:
         raise HTTPException(404, "Not found")
-    return {
+    graph = {
         "project": {"id": proj.id, "name": proj.name, "description": proj.description, "createdAt": proj.created_at, "updatedAt": proj.updated_at},
         "nodes": [{"id": n.id, "label": n.label, "status": n.status, "priority": n.priority, "progress": n.progress, "tags": (n.tags or "").split(",") if n.tags else []} for n in nodes],
         "edges": [{"source": e.source, "target": e.target, "kind": e.kind, "weight": e.weight} for e in edges],
         "milestones": [{"id": m.id, "title": m.title, "date": m.date, "status": m.status} for m in miles],
     }
+    body = json.dumps(graph).encode()
+    graph_cache.put(pid, "legacy", body)
+    return Response(content=body, media_type="application/json")
 
 @router.put("/projects/{pid}/graph")
 async def put_project_graph(pid: str, g: GraphData, session: Session = Depends(get_session)):
     if g.project.id != pid:
         raise HTTPException(400, "Project id mismatch")
-    replace_graph(session, g)
-    await broadcast(pid, "graph_changed", {"reason": "replace"})
-    return {"ok": True}
+    _, diff = replace_graph(session, g)
+    graph_cache.invalidate(pid)
+    await broadcast(pid, "graph_changed", {"reason": "replace", "diff": diff})
+    return {"ok": True, "diff": diff}
 
 @router.post("/projects/{pid}/nodes")
 async def add_node(pid: str, node: NodeData, session: Session = Depends(get_session)):
@@ -88,6 +107,7 @@ async def add_node(pid: str, node: NodeData, session: Session = Depends(get_sess
     n = Node(id=node.id, project_id=pid, label=node.label, status=node.status, priority=node.priority, progress=node.progress, tags=",".join(node.tags or []))
     session.add(n)
     session.commit()
+    graph_cache.invalidate(pid)
     await broadcast(pid, "graph_changed", {"reason": "node_added", "node": node.id})
     return {"ok": True}
 
@@ -110,6 +130,7 @@ async def patch_node(pid: str, nid: str, patch: NodePatch, session: Session = De
     
     session.add(n)
     session.commit()
+    graph_cache.invalidate(pid)
     await broadcast(pid, "graph_changed", {"reason": "node_updated", "node": nid})
     return {"ok": True}
 
@@ -121,6 +142,7 @@ async def del_node(pid: str, nid: str, session: Session = Depends(get_session)):
     session.exec(delete(Edge).where((Edge.project_id == pid) & ((Edge.source == nid) | (Edge.target == nid))))
     session.delete(n)
     session.commit()
+    graph_cache.invalidate(pid)
     await broadcast(pid, "graph_changed", {"reason": "node_removed", "node": nid})
     return {"ok": True}
 
@@ -131,6 +153,7 @@ async def add_edge(pid: str, edge: EdgeData, session: Session = Depends(get_sess
         raise HTTPException(404, "Project not found")
     session.add(Edge(project_id=pid, source=edge.source, target=edge.target, kind=edge.kind, weight=edge.weight))
     session.commit()
+    graph_cache.invalidate(pid)
     await broadcast(pid, "graph_changed", {"reason": "edge_added", "source": edge.source, "target": edge.target})
     return {"ok": True}
 
@@ -139,6 +162,7 @@ async def del_edge(pid: str, sid: str, tid: str, session: Session = Depends(get_
     stmt = delete(Edge).where((Edge.project_id == pid) & (Edge.source == sid) & (Edge.target == tid))
     session.exec(stmt)
     session.commit()
+    graph_cache.invalidate(pid)
     await broadcast(pid, "graph_changed", {"reason": "edge_removed", "source": sid, "target": tid})
     return {"ok": True}
 
@@ -155,6 +179,7 @@ async def add_milestone(pid: str, m: MilestoneSchema, session: Session = Depends
     ms = Milestone(id=m.id, project_id=pid, title=m.title, date=m.date, status=m.status)
     session.add(ms)
     session.commit()
+    graph_cache.invalidate(pid)
     await broadcast(pid, "graph_changed", {"reason": "milestone_added", "milestone": m.id})
     return {"ok": True}
 
@@ -173,6 +198,7 @@ async def patch_milestone(pid: str, mid: str, patch: MilestonePatch, session: Se
     
     session.add(m)
     session.commit()
+    graph_cache.invalidate(pid)
     await broadcast(pid, "graph_changed", {"reason": "milestone_updated", "milestone": mid})
     return {"ok": True}
 
@@ -184,6 +210,7 @@ async def delete_milestone(pid: str, mid: str, session: Session = Depends(get_se
     
     session.delete(m)
     session.commit()
+    graph_cache.invalidate(pid)
     await broadcast(pid, "graph_changed", {"reason": "milestone_deleted", "milestone": mid})
     return {"ok": True}
 
@@ -1,6 +1,6 @@
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
 from app.schemas.node import NodeCreate, NodeUpdate, NodeResponse
-from app.schemas.edge import EdgeCreate, EdgeResponse
+from app.schemas.edge import EdgeCreate, EdgeUpdate, EdgeResponse
 from app.schemas.milestone import MilestoneCreate, MilestoneUpdate, MilestoneResponse
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     "NodeUpdate",
     "NodeResponse",
     "EdgeCreate",
+    "EdgeUpdate",
     "EdgeResponse",
     "MilestoneCreate",
     "MilestoneUpdate",
@@ -2,7 +2,7 @@
 Pydantic schemas for sibling actions and context rules.
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from enum import Enum
 
 
@@ -122,3 +122,40 @@ class ActionExecutionResult(BaseModel):
                 "executed_at": "2025-09-30T12:00:00Z"
             }
         }
+
+
+class BatchActionsRequest(BaseModel):
+    """Request schema for resolving actions for many nodes at once."""
+    node_ids: Optional[List[str]] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "node_ids": ["node-1", "node-2"]
+            }
+        }
+
+
+class BatchActionsResponse(BaseModel):
+    """
+    Response schema for batch action resolution.
+    Action IDs are listed once per distinct (type, status) context.
+    """
+    contexts: Dict[str, List[str]]
+    nodes: Dict[str, str]
+    missing: List[str] = []
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "contexts": {
+                    "TASK:IN_PROGRESS": ["view-dependencies", "update-progress", "add-note"],
+                    "ROOT:IDLE": ["view-timeline", "view-status-log"]
+                },
+                "nodes": {
+                    "node-1": "TASK:IN_PROGRESS",
+                    "node-2": "ROOT:IDLE"
+                },
+                "missing": []
+            }
+        }
@@ -0,0 +1,54 @@
+"""
+Pydantic schemas for batched graph mutations.
+"""
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+
+
+BatchEntity = Literal["node", "edge", "milestone"]
+BatchOpType = Literal["create", "patch", "delete"]
+BatchOpStatus = Literal["ok", "error", "skipped"]
+
+
+class BatchOperation(BaseModel):
+    """A single create, patch or delete of a node, edge or milestone."""
+    op: BatchOpType
+    entity: BatchEntity
+    id: Optional[str] = None  # required for patch/delete, optional for create
+    data: Dict[str, Any] = {}
+
+
+class BatchRequest(BaseModel):
+    """Ordered list of operations applied in one transaction."""
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=10000)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "operations": [
+                    {"op": "create", "entity": "node", "id": "task-1",
+                     "data": {"label": "Write docs", "type": "TASK"}},
+                    {"op": "patch", "entity": "node", "id": "task-2",
+                     "data": {"status": "BLOCKED"}},
+                    {"op": "create", "entity": "edge",
+                     "data": {"source": "task-1", "target": "task-2", "type": "dependency"}},
+                    {"op": "delete", "entity": "milestone", "id": "ms-1"}
+                ]
+            }
+        }
+
+
+class BatchOperationResult(BaseModel):
+    """Outcome of one operation in a batch."""
+    index: int
+    op: BatchOpType
+    entity: BatchEntity
+    id: Optional[str] = None
+    status: BatchOpStatus
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    """Response schema for a committed batch."""
+    revision: int
+    results: List[BatchOperationResult]
@@ -19,6 +19,12 @@ class EdgeCreate(BaseModel):
     metadata: Optional[EdgeMetadata] = None
 
 
+class EdgeUpdate(BaseModel):
+    type: Optional[EdgeType] = None
+    status: Optional[EdgeStatus] = None
+    metadata: Optional[EdgeMetadata] = None
+
+
 class EdgeResponse(EdgeCreate):
     id: str
     project_id: str
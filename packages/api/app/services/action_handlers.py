@@ -5,6 +5,8 @@ from typing import Callable, Dict, Optional, Any
 from datetime import datetime
 from app.models.node import Node
 from app.schemas.action import ActionExecutionResult, ActionExecutionStatus
+from app.services.graph_cache import graph_cache
+from app.services.change_log import record_change
 from sqlalchemy.orm import Session
 import json
 
@@ -268,7 +270,9 @@ class ActionHandlerRegistry:
         old_status = node.status
         node.status = "COMPLETED"
         node.progress = 100
+        record_change(db, node.project_id, "node", node.id, "update")
         db.commit()
+        graph_cache.invalidate(node.project_id)
 
         return {
             "action": "mark-complete",
@@ -300,7 +304,9 @@ class ActionHandlerRegistry:
         elif new_progress > 0:
             node.status = "IN_PROGRESS"
 
+        record_change(db, node.project_id, "node", node.id, "update")
         db.commit()
+        graph_cache.invalidate(node.project_id)
 
         return {
             "action": "update-progress",
@@ -328,7 +334,9 @@ class ActionHandlerRegistry:
         else:
             raise ValueError(f"Cannot pause/resume from status: {node.status}")
 
+        record_change(db, node.project_id, "node", node.id, "update")
         db.commit()
+        graph_cache.invalidate(node.project_id)
 
         return {
             "action": "pause-resume",
@@ -347,7 +355,9 @@ class ActionHandlerRegistry:
         """Handle start task action."""
         old_status = node.status
         node.status = "IN_PROGRESS"
+        record_change(db, node.project_id, "node", node.id, "update")
         db.commit()
+        graph_cache.invalidate(node.project_id)
 
         return {
             "action": "start-task",
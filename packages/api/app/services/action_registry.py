@@ -1,7 +1,7 @@
 """
 Central registry for sibling actions and context rules.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, FrozenSet, Tuple
 from app.schemas.action import SiblingAction, ContextRule, ActionType, ActionCategory
 
 
@@ -15,11 +15,17 @@ class ActionRegistry:
     _actions: Dict[str, SiblingAction] = {}
     _context_rules: Dict[str, ContextRule] = {}
 
+    # Compiled lookup tables keyed by (node_type, node_status). A status of
+    # None holds the actions from rules that apply to every status.
+    _context_index: Dict[Tuple[str, Optional[str]], List[SiblingAction]] = {}
+    _context_action_ids: Dict[Tuple[str, Optional[str]], FrozenSet[str]] = {}
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ActionRegistry, cls).__new__(cls)
             cls._instance._init_default_actions()
             cls._instance._init_default_context_rules()
+            cls._instance._rebuild_context_index()
         return cls._instance
 
     def _init_default_actions(self) -> None:
@@ -681,13 +687,64 @@ class ActionRegistry:
         for rule in default_rules:
             self._context_rules[rule.id] = rule
 
+    def _rebuild_context_index(self) -> None:
+        """
+        Compile context rules into per-(type, status) action lists.
+        Called once at startup and again whenever actions or rules change.
+        """
+        type_wide: Dict[str, List[str]] = {}
+        by_status: Dict[Tuple[str, str], List[str]] = {}
+
+        for rule in self._context_rules.values():
+            for node_type in rule.node_types:
+                if rule.node_statuses:
+                    for node_status in rule.node_statuses:
+                        by_status.setdefault((node_type, node_status), []).extend(rule.actions)
+                else:
+                    type_wide.setdefault(node_type, []).extend(rule.actions)
+
+        keys: Dict[Tuple[str, Optional[str]], List[str]] = {
+            (node_type, None): list(action_ids)
+            for node_type, action_ids in type_wide.items()
+        }
+        for (node_type, node_status), action_ids in by_status.items():
+            keys[(node_type, node_status)] = type_wide.get(node_type, []) + action_ids
+
+        context_index: Dict[Tuple[str, Optional[str]], List[SiblingAction]] = {}
+        context_action_ids: Dict[Tuple[str, Optional[str]], FrozenSet[str]] = {}
+        for key, action_ids in keys.items():
+            actions = [
+                self._actions[action_id]
+                for action_id in dict.fromkeys(action_ids)
+                if action_id in self._actions
+            ]
+            # Sort by priority (lower number = higher priority)
+            actions.sort(key=lambda a: a.priority)
+            context_index[key] = actions
+            context_action_ids[key] = frozenset(action.id for action in actions)
+
+        ActionRegistry._context_index = context_index
+        ActionRegistry._context_action_ids = context_action_ids
+
+    def _context_key(
+        self,
+        node_type: str,
+        node_status: Optional[str]
+    ) -> Tuple[str, Optional[str]]:
+        """Resolve the compiled index key for a node context."""
+        if node_status is not None and (node_type, node_status) in self._context_index:
+            return (node_type, node_status)
+        return (node_type, None)
+
     def register_action(self, action: SiblingAction) -> None:
         """Register a new action."""
         self._actions[action.id] = action
+        self._rebuild_context_index()
 
     def register_context_rule(self, rule: ContextRule) -> None:
         """Register a new context rule."""
         self._context_rules[rule.id] = rule
+        self._rebuild_context_index()
 
     def get_action(self, action_id: str) -> Optional[SiblingAction]:
         """Get action by ID."""
@@ -720,31 +777,23 @@ class ActionRegistry:
         """
         Get applicable actions for a given node type and status.
         Returns actions sorted by priority.
-        """
-        applicable_action_ids = set()
 
-        # Find matching context rules
-        for rule in self._context_rules.values():
-            if node_type in rule.node_types:
-                # If rule has status requirements, check them
-                if rule.node_statuses:
-                    if node_status and node_status in rule.node_statuses:
-                        applicable_action_ids.update(rule.actions)
-                else:
-                    # Rule applies to all statuses
-                    applicable_action_ids.update(rule.actions)
-
-        # Convert action IDs to action objects
-        actions = [
-            self._actions[action_id]
-            for action_id in applicable_action_ids
-            if action_id in self._actions
-        ]
-
-        # Sort by priority (lower number = higher priority)
-        actions.sort(key=lambda a: a.priority)
+        The returned list is shared with the compiled index and must not be
+        mutated by callers.
+        """
+        return self._context_index.get(self._context_key(node_type, node_status), [])
 
-        return actions
+    def get_action_ids_for_context(
+        self,
+        node_type: str,
+        node_status: Optional[str] = None
+    ) -> FrozenSet[str]:
+        """
+        Get the set of action IDs available for a given node type and status.
+        """
+        return self._context_action_ids.get(
+            self._context_key(node_type, node_status), frozenset()
+        )
 
     def validate_action(
         self,
@@ -755,8 +804,7 @@ class ActionRegistry:
         """
         Validate if an action is available for a given node context.
         """
-        available_actions = self.get_actions_for_context(node_type, node_status)
-        return action_id in [action.id for action in available_actions]
+        return action_id in self.get_action_ids_for_context(node_type, node_status)
 
 
 # Singleton instance
@@ -0,0 +1,89 @@
+"""
+Bulk row ingestion for large graph imports.
+"""
+import csv
+import io
+import json
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+
+def batched(rows: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield lists of at most batch_size rows."""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def bulk_insert(
+    db: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int
+) -> int:
+    """
+    Insert fully populated rows into a table in batches, bypassing the
+    ORM unit of work. Uses COPY FROM STDIN on PostgreSQL and Core
+    executemany inserts elsewhere. Runs inside the caller's transaction.
+    Returns the number of rows written.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return _copy_rows(db, table, rows, batch_size)
+
+    count = 0
+    for batch in batched(rows, batch_size):
+        db.execute(insert(table), batch)
+        count += len(batch)
+    return count
+
+
+def _copy_rows(
+    db: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int
+) -> int:
+    driver_connection = db.connection().connection.driver_connection
+    count = 0
+
+    for batch in batched(rows, batch_size):
+        columns = list(batch[0].keys())
+        sql = 'COPY {} ({}) FROM STDIN WITH (FORMAT csv)'.format(
+            table.name, ", ".join(f'"{column}"' for column in columns)
+        )
+        cursor = driver_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):
+                # psycopg2
+                cursor.copy_expert(sql, _csv_buffer(batch, columns))
+            else:
+                # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(_csv_buffer(batch, columns).getvalue())
+        finally:
+            cursor.close()
+        count += len(batch)
+
+    return count
+
+
+def _csv_buffer(batch: List[Dict[str, Any]], columns: List[str]) -> io.StringIO:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in batch:
+        writer.writerow([_csv_value(row[column]) for column in columns])
+    buffer.seek(0)
+    return buffer
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""  # unquoted empty field is NULL in CSV COPY
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
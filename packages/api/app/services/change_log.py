@@ -0,0 +1,132 @@
+"""
+Persisted per-project graph change log for delta sync.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.graph_change import GraphChange
+from app.models.project import Project
+from app.services.revisions import bump_revision
+
+ENTITIES = ("node", "edge", "milestone")
+
+
+class ChangeSet(NamedTuple):
+    """Net effect of the changes in a revision window, per entity type."""
+    revision: int
+    upserted: Dict[str, List[str]]
+    deleted: Dict[str, List[str]]
+
+
+def record_changes(
+    db: Session,
+    project_id: str,
+    changes: Iterable[Tuple[str, str, str]]
+) -> int:
+    """
+    Bump the project revision and log (entity, entity_id, op) changes
+    under it, inside the caller's transaction. Returns the new revision.
+    """
+    revision = bump_revision(db, project_id)
+    db.add_all([
+        GraphChange(
+            project_id=project_id,
+            revision=revision,
+            entity=entity,
+            entity_id=entity_id,
+            op=op
+        )
+        for entity, entity_id, op in changes
+    ])
+
+    retention = settings.CHANGE_LOG_RETENTION
+    if retention > 0 and revision % retention == 0:
+        compact_changes(db, project_id, revision - retention)
+
+    return revision
+
+
+def record_change(
+    db: Session,
+    project_id: str,
+    entity: str,
+    entity_id: str,
+    op: str
+) -> int:
+    """Log a single entity change. See record_changes."""
+    return record_changes(db, project_id, [(entity, entity_id, op)])
+
+
+def reset_changes(db: Session, project_id: str) -> int:
+    """
+    Bump the project revision without logging individual changes, for
+    writes too large to log row by row. Every client must reload the
+    full graph afterwards. Returns the new revision.
+    """
+    revision = bump_revision(db, project_id)
+    compact_changes(db, project_id, revision)
+    return revision
+
+
+def compact_changes(db: Session, project_id: str, up_to_revision: int) -> None:
+    """
+    Drop log entries at or below a revision. Clients holding an older
+    revision must then reload the full graph.
+    """
+    db.query(GraphChange).filter(
+        GraphChange.project_id == project_id,
+        GraphChange.revision <= up_to_revision
+    ).delete(synchronize_session=False)
+    db.query(Project).filter(
+        Project.id == project_id,
+        Project.compacted_revision < up_to_revision
+    ).update({Project.compacted_revision: up_to_revision}, synchronize_session=False)
+
+
+def changes_since(db: Session, project_id: str, since: int) -> Optional[ChangeSet]:
+    """
+    Collapse the log entries after a revision into the net set of
+    upserted and deleted entity IDs.
+    Returns None if the project does not exist or the revision has been
+    compacted away (or is ahead of the project), meaning the client needs
+    a full snapshot.
+    """
+    row = (
+        db.query(Project.revision, Project.compacted_revision)
+        .filter(Project.id == project_id)
+        .first()
+    )
+    if row is None:
+        return None
+    if since < (row.compacted_revision or 0) or since > row.revision:
+        return None
+
+    entries = (
+        db.query(GraphChange.entity, GraphChange.entity_id, GraphChange.op)
+        .filter(
+            GraphChange.project_id == project_id,
+            GraphChange.revision > since,
+            GraphChange.revision <= row.revision
+        )
+        .order_by(GraphChange.revision, GraphChange.id)
+        .all()
+    )
+
+    # Net effect per entity: first op seen in the window and last op seen
+    net: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for entity, entity_id, op in entries:
+        key = (entity, entity_id)
+        first_op = net[key][0] if key in net else op
+        net[key] = (first_op, op)
+
+    upserted: Dict[str, List[str]] = {entity: [] for entity in ENTITIES}
+    deleted: Dict[str, List[str]] = {entity: [] for entity in ENTITIES}
+    for (entity, entity_id), (first_op, last_op) in net.items():
+        if last_op == "delete":
+            # Created and removed inside the window: the client never saw it
+            if first_op != "insert":
+                deleted.setdefault(entity, []).append(entity_id)
+        else:
+            upserted.setdefault(entity, []).append(entity_id)
+
+    return ChangeSet(revision=row.revision, upserted=upserted, deleted=deleted)
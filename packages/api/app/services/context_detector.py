@@ -1,7 +1,7 @@
 """
 Context detection service for determining available sibling actions.
 """
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from app.models.node import Node
 from app.schemas.action import SiblingAction
 from app.services.action_registry import action_registry
@@ -26,6 +26,34 @@ class ContextDetector:
             node_status=node.status
         )
 
+    def detect_actions_for_nodes(
+        self,
+        nodes: Iterable[Tuple[str, str, Optional[str]]]
+    ) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+        """
+        Detect available actions for many nodes at once.
+        Takes (node_id, node_type, node_status) rows and resolves actions
+        once per distinct (type, status) context.
+        Returns a map of context key to action IDs and a map of node ID
+        to context key.
+        """
+        contexts: Dict[str, List[str]] = {}
+        node_contexts: Dict[str, str] = {}
+
+        for node_id, node_type, node_status in nodes:
+            context_key = f"{node_type}:{node_status or ''}"
+            if context_key not in contexts:
+                contexts[context_key] = [
+                    action.id
+                    for action in self.registry.get_actions_for_context(
+                        node_type=node_type,
+                        node_status=node_status
+                    )
+                ]
+            node_contexts[node_id] = context_key
+
+        return contexts, node_contexts
+
     def expand_group(
         self,
         group_id: str,
@@ -39,8 +67,10 @@ class ContextDetector:
         group_actions = self.registry.get_actions_by_group(group_id)
 
         # Filter by node context
-        available_actions = self.detect_actions(node)
-        available_ids = {action.id for action in available_actions}
+        available_ids = self.registry.get_action_ids_for_context(
+            node_type=node.type,
+            node_status=node.status
+        )
 
         # Return only group actions that are also available for this node
         filtered_actions = [
@@ -0,0 +1,100 @@
+"""
+Per-project coalescing of graph_changed events.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+FlushCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class PendingChanges:
+    """Touched entity IDs accumulated for one project within a window."""
+
+    def __init__(self):
+        self.reasons: List[str] = []
+        self.events = 0
+        self.nodes: Set[str] = set()
+        self.edges: Set[Tuple[str, str]] = set()
+        self.milestones: Set[str] = set()
+        self.replaced = False
+
+    def add(
+        self,
+        reason: str,
+        nodes: Iterable[str] = (),
+        edges: Iterable[Tuple[str, str]] = (),
+        milestones: Iterable[str] = (),
+        replaced: bool = False
+    ) -> None:
+        self.events += 1
+        if reason not in self.reasons:
+            self.reasons.append(reason)
+        self.nodes.update(nodes)
+        self.edges.update(tuple(edge) for edge in edges)
+        self.milestones.update(milestones)
+        self.replaced = self.replaced or replaced
+
+    def payload(self) -> Dict[str, Any]:
+        return {
+            "reason": self.reasons[0] if len(self.reasons) == 1 else "coalesced",
+            "reasons": self.reasons,
+            "events": self.events,
+            "nodes": sorted(self.nodes),
+            "edges": [list(edge) for edge in sorted(self.edges)],
+            "milestones": sorted(self.milestones),
+            "replaced": self.replaced,
+        }
+
+
+class EventCoalescer:
+    """
+    Merges graph_changed events per project over a fixed window. The
+    first event in a quiet period opens the window; everything arriving
+    before it closes goes out as one message, so each project emits at
+    most one message per window however fast writes arrive.
+    Must be used from the event loop thread.
+    """
+
+    def __init__(self, window_ms: int, flush: FlushCallback):
+        self.window = window_ms / 1000
+        self._flush = flush
+        self._pending: Dict[str, PendingChanges] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+
+    async def add(
+        self,
+        project_id: str,
+        reason: str,
+        nodes: Iterable[str] = (),
+        edges: Iterable[Tuple[str, str]] = (),
+        milestones: Iterable[str] = (),
+        replaced: bool = False
+    ) -> None:
+        """Record a change. Flushes immediately when the window is zero."""
+        pending = self._pending.setdefault(project_id, PendingChanges())
+        pending.add(reason, nodes, edges, milestones, replaced)
+
+        if self.window <= 0:
+            await self.flush(project_id)
+        elif project_id not in self._timers:
+            self._timers[project_id] = asyncio.create_task(self._flush_later(project_id))
+
+    async def flush(self, project_id: str) -> None:
+        """Send whatever is pending for a project now."""
+        timer = self._timers.pop(project_id, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        pending = self._pending.pop(project_id, None)
+        if pending is not None:
+            await self._flush(project_id, pending.payload())
+
+    async def flush_all(self) -> None:
+        for project_id in list(self._pending):
+            await self.flush(project_id)
+
+    def pending(self, project_id: str) -> Optional[PendingChanges]:
+        return self._pending.get(project_id)
+
+    async def _flush_later(self, project_id: str) -> None:
+        await asyncio.sleep(self.window)
+        await self.flush(project_id)
@@ -0,0 +1,106 @@
+"""
+In-process LRU cache for serialized project graph payloads.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Set, Tuple
+from app.config import settings
+
+
+class GraphCache:
+    """
+    Size-bounded LRU cache of serialized graph responses, keyed by
+    project and view. Entries hold the encoded response body so a hit
+    skips both the database queries and the serialization.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._views: Dict[str, Set[str]] = {}
+        self._size = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, project_id: str, view: str) -> Optional[bytes]:
+        """Get a cached payload and mark it as recently used."""
+        key = (project_id, view)
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, project_id: str, view: str, body: bytes) -> None:
+        """
+        Store a payload, evicting least recently used entries until the
+        cache fits its memory budget. Payloads larger than the whole
+        budget are not cached.
+        """
+        if len(body) > self.max_bytes:
+            return
+
+        key = (project_id, view)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = body
+            self._views.setdefault(project_id, set()).add(view)
+            self._size += len(body)
+
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def invalidate(self, project_id: str) -> None:
+        """Drop every cached view of a project."""
+        with self._lock:
+            views = self._views.get(project_id)
+            if not views:
+                return
+            for view in list(views):
+                self._discard((project_id, view))
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._views.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters for monitoring."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _discard(self, key: Tuple[str, str]) -> None:
+        body = self._entries.pop(key, None)
+        if body is None:
+            return
+        self._size -= len(body)
+        project_id, view = key
+        views = self._views.get(project_id)
+        if views is not None:
+            views.discard(view)
+            if not views:
+                del self._views[project_id]
+
+
+# Singleton instance
+graph_cache = GraphCache(max_bytes=settings.GRAPH_CACHE_MAX_BYTES)
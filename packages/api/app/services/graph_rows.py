@@ -0,0 +1,82 @@
+"""
+Mapping from graph entity schemas to table column values.
+"""
+import uuid
+from typing import Any, Dict, Optional
+from app.schemas.node import NodeCreate, NodeUpdate
+from app.schemas.edge import EdgeCreate, EdgeUpdate
+from app.schemas.milestone import MilestoneCreate, MilestoneUpdate
+
+
+def node_row(project_id: str, node: NodeCreate, node_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build a fully populated nodes row. Tags and dependencies have no
+    columns of their own and are kept in metadata.
+    """
+    metadata = node.metadata.model_dump(mode="json", exclude_none=True)
+    if node.tags:
+        metadata["tags"] = node.tags
+    if node.dependencies:
+        metadata["dependencies"] = node.dependencies
+    return {
+        "id": node_id or str(uuid.uuid4()),
+        "project_id": project_id,
+        "label": node.label,
+        "type": node.type,
+        "status": node.status,
+        "priority": node.priority,
+        "progress": node.progress,
+        "parent_id": node.parent_id,
+        "metadata": metadata,
+    }
+
+
+def node_update_values(current_metadata: Optional[dict], update: NodeUpdate) -> Dict[str, Any]:
+    """Build column values for the fields set on a node update."""
+    values = update.model_dump(mode="json", exclude_unset=True)
+    extra = {key: values.pop(key) for key in ("tags", "dependencies") if key in values}
+    if "metadata" in values or extra:
+        metadata = dict(current_metadata or {})
+        metadata.update({k: v for k, v in (values.pop("metadata", None) or {}).items() if v is not None})
+        metadata.update(extra)
+        values["metadata"] = metadata
+    return values
+
+
+def edge_row(project_id: str, edge: EdgeCreate, edge_id: Optional[str] = None) -> Dict[str, Any]:
+    """Build a fully populated edges row."""
+    return {
+        "id": edge_id or str(uuid.uuid4()),
+        "project_id": project_id,
+        "source": edge.source,
+        "target": edge.target,
+        "type": edge.type,
+        "status": edge.status,
+        "metadata": edge.metadata.model_dump(exclude_none=True) if edge.metadata else {},
+    }
+
+
+def edge_update_values(update: EdgeUpdate) -> Dict[str, Any]:
+    """Build column values for the fields set on an edge update."""
+    values = update.model_dump(exclude_unset=True)
+    if values.get("metadata") is not None:
+        values["metadata"] = {k: v for k, v in values["metadata"].items() if v is not None}
+    return values
+
+
+def milestone_row(
+    project_id: str,
+    milestone: MilestoneCreate,
+    milestone_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a fully populated milestones row."""
+    return {
+        "id": milestone_id or str(uuid.uuid4()),
+        "project_id": project_id,
+        **milestone.model_dump(),
+    }
+
+
+def milestone_update_values(update: MilestoneUpdate) -> Dict[str, Any]:
+    """Build column values for the fields set on a milestone update."""
+    return update.model_dump(exclude_unset=True)
@@ -0,0 +1,289 @@
+"""
+Cross-worker broadcast bus for websocket fan-out.
+
+Every worker delivers its own messages to its local connections straight
+away and publishes them on the bus; the other workers receive them once
+through a single subscription and fan out to their local connections.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+import uuid
+from typing import Any, Callable, Dict, Optional, Set
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str, Dict[str, Any]], None]
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_MAX_BYTES = 7900
+
+
+class BroadcastBus:
+    """
+    Base bus: local delivery only. Subclasses relay to other workers by
+    overriding _start, _stop and _relay, and pass what they receive to
+    _receive. Must be used from the event loop thread.
+    """
+
+    def __init__(self):
+        self.origin = uuid.uuid4().hex
+        self.started = False
+        self._handlers: Dict[str, Handler] = {}
+        self._resync: Dict[str, Dict[str, Any]] = {}
+
+    def subscribe(self, topic: str, handler: Handler, resync_message: Dict[str, Any]) -> None:
+        """
+        Register the local fan-out for a topic. resync_message is
+        delivered instead of messages too large to relay.
+        """
+        self._handlers[topic] = handler
+        self._resync[topic] = resync_message
+
+    async def start(self) -> None:
+        if not self.started:
+            await self._start()
+            self.started = True
+
+    async def stop(self) -> None:
+        if self.started:
+            self.started = False
+            await self._stop()
+
+    async def publish(self, topic: str, project_id: str, message: Dict[str, Any]) -> None:
+        """Deliver a message locally, then relay it to the other workers."""
+        self._deliver(topic, project_id, message)
+        if not self.started:
+            return
+
+        envelope = {"origin": self.origin, "topic": topic, "project_id": project_id, "message": message}
+        data = json.dumps(envelope, separators=(",", ":"))
+        if len(data.encode()) > self.max_payload_bytes:
+            envelope["message"] = None
+            data = json.dumps(envelope, separators=(",", ":"))
+        try:
+            await self._relay(data)
+        except Exception:
+            logger.exception("Failed to relay broadcast for project %s", project_id)
+
+    @property
+    def max_payload_bytes(self) -> int:
+        return 1 << 30
+
+    def _receive(self, data: str) -> None:
+        try:
+            envelope = json.loads(data)
+        except ValueError:
+            logger.warning("Dropping malformed bus message")
+            return
+        if envelope.get("origin") == self.origin:
+            return
+        topic = envelope.get("topic")
+        message = envelope.get("message")
+        if message is None:
+            message = self._resync.get(topic)
+        if message is not None:
+            self._deliver(topic, envelope.get("project_id"), message)
+
+    def _deliver(self, topic: str, project_id: str, message: Dict[str, Any]) -> None:
+        handler = self._handlers.get(topic)
+        if handler is not None:
+            handler(project_id, message)
+
+    async def _start(self) -> None:
+        pass
+
+    async def _stop(self) -> None:
+        pass
+
+    async def _relay(self, data: str) -> None:
+        pass
+
+
+class MemoryBus(BroadcastBus):
+    """Single-process bus. Nothing is relayed."""
+
+
+class UnixSocketBus(BroadcastBus):
+    """
+    Relays through a broker on a local Unix socket. The first worker
+    that finds no live broker binds the socket and becomes the broker;
+    the others connect to it. If the broker goes away the survivors
+    reconnect, and one of them takes over.
+    """
+
+    RECONNECT_DELAY = 0.5
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._serving = False
+        self._peers: Set[asyncio.StreamWriter] = set()
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def _start(self) -> None:
+        reader = await self._connect()
+        self._reader_task = asyncio.create_task(self._read_loop(reader))
+
+    async def _stop(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+        if self._writer is not None:
+            self._writer.close()
+        if self._server is not None:
+            self._serving = False
+            server, self._server = self._server, None
+            server.close()
+            for peer in list(self._peers):
+                peer.close()
+            await server.wait_closed()
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    async def _relay(self, data: str) -> None:
+        if self._writer is None:
+            return
+        self._writer.write(data.encode() + b"\n")
+        await self._writer.drain()
+
+    async def _connect(self) -> asyncio.StreamReader:
+        while True:
+            try:
+                reader, self._writer = await asyncio.open_unix_connection(self.path, limit=1 << 24)
+                return reader
+            except FileNotFoundError:
+                await self._become_broker(stale=False)
+            except ConnectionRefusedError:
+                await self._become_broker(stale=True)
+
+    async def _become_broker(self, stale: bool) -> None:
+        try:
+            # A refused connection means nobody is listening on the file
+            if stale:
+                os.unlink(self.path)
+            # Bind by hand: start_unix_server would silently replace a
+            # socket file another worker has just bound
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.bind(self.path)
+            except OSError:
+                sock.close()
+                raise
+            self._serving = True
+            self._server = await asyncio.start_unix_server(self._serve_peer, sock=sock, limit=1 << 24)
+            logger.info("Broadcast broker listening on %s", self.path)
+        except OSError:
+            # Another worker won the race; connect to it instead
+            await asyncio.sleep(self.RECONNECT_DELAY * 0.1)
+
+    async def _serve_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if not self._serving:
+            # Accepted just before the broker stopped
+            writer.close()
+            return
+        self._peers.add(writer)
+        try:
+            while line := await self._readline(reader):
+                for peer in list(self._peers):
+                    if peer is writer:
+                        continue
+                    try:
+                        peer.write(line)
+                    except Exception:
+                        self._peers.discard(peer)
+        finally:
+            self._peers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _readline(reader: asyncio.StreamReader) -> bytes:
+        """Read one frame; a dropped connection reads as end of stream."""
+        try:
+            return await reader.readline()
+        except (ConnectionError, ValueError):
+            return b""
+
+    async def _read_loop(self, reader: Optional[asyncio.StreamReader]) -> None:
+        while True:
+            if reader is None:
+                reader = await self._connect()
+            line = await self._readline(reader)
+            if line:
+                self._receive(line.decode())
+                continue
+            # Broker went away; reconnect (or take over)
+            reader = None
+            self._writer = None
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+
+class PostgresBus(BroadcastBus):
+    """
+    Relays through Postgres LISTEN/NOTIFY on one channel. Needs asyncpg.
+    Messages over the NOTIFY size limit are relayed as a resync marker.
+    """
+
+    def __init__(self, dsn: str, channel: str):
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self._connection = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def max_payload_bytes(self) -> int:
+        return NOTIFY_MAX_BYTES
+
+    async def _start(self) -> None:
+        try:
+            import asyncpg
+        except ImportError as e:
+            raise RuntimeError("BROADCAST_BACKEND=postgres requires asyncpg") from e
+        self._connection = await asyncpg.connect(self.dsn)
+        await self._connection.add_listener(self.channel, self._on_notify)
+
+    async def _stop(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def _relay(self, data: str) -> None:
+        # asyncpg runs one query at a time per connection
+        async with self._lock:
+            await self._connection.execute("SELECT pg_notify($1, $2)", self.channel, data)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._receive(payload)
+
+
+def _postgres_dsn(database_url: str) -> str:
+    # asyncpg takes a plain libpq URL, without the SQLAlchemy driver suffix
+    scheme, _, rest = database_url.partition("://")
+    return f"postgresql://{rest}" if scheme.startswith("postgresql") else database_url
+
+
+def create_bus(backend: str) -> BroadcastBus:
+    if backend == "memory":
+        return MemoryBus()
+    if backend == "unix":
+        return UnixSocketBus(settings.BROADCAST_SOCKET_PATH)
+    if backend == "postgres":
+        return PostgresBus(
+            settings.BROADCAST_DSN or _postgres_dsn(settings.DATABASE_URL),
+            settings.BROADCAST_CHANNEL
+        )
+    raise ValueError(f"Unknown broadcast backend: {backend}")
+
+
+bus = create_bus(settings.BROADCAST_BACKEND)
@@ -0,0 +1,44 @@
+"""
+Per-project graph revision counter.
+"""
+from datetime import datetime
+from typing import NamedTuple, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models.project import Project
+
+
+class ProjectRevision(NamedTuple):
+    revision: int
+    updated_at: Optional[datetime]
+
+
+def bump_revision(db: Session, project_id: str) -> int:
+    """
+    Increment a project's revision inside the caller's transaction.
+    Must be called before the commit of every graph write.
+    """
+    db.query(Project).filter(Project.id == project_id).update(
+        {
+            Project.revision: Project.revision + 1,
+            Project.updated_at: func.now(),
+        },
+        synchronize_session=False,
+    )
+    revision = db.query(Project.revision).filter(Project.id == project_id).scalar()
+    return revision or 0
+
+
+def get_revision(db: Session, project_id: str) -> Optional[ProjectRevision]:
+    """
+    Get a project's current revision and modification time.
+    Reads only the projects table.
+    """
+    row = (
+        db.query(Project.revision, Project.updated_at, Project.created_at)
+        .filter(Project.id == project_id)
+        .first()
+    )
+    if row is None:
+        return None
+    return ProjectRevision(revision=row.revision or 0, updated_at=row.updated_at or row.created_at)
@@ -0,0 +1,131 @@
+"""
+Per-connection outbound queues for websocket fan-out.
+"""
+import asyncio
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Iterable, Optional
+from fastapi import WebSocket
+
+
+class SlowConsumerPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"  # discard the oldest queued message
+    COALESCE = "coalesce"  # replace the backlog with a single resync message
+    DISCONNECT = "disconnect"  # close the connection
+
+
+class ConnectionOutbox:
+    """
+    Bounded send queue for one websocket, drained by its own writer task.
+    Enqueueing never awaits the socket, so a slow client only delays
+    its own messages. Must be used from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_size: int,
+        policy: SlowConsumerPolicy,
+        resync_message: Optional[Dict[str, Any]] = None
+    ):
+        self.websocket = websocket
+        self.max_size = max_size
+        self.policy = policy
+        self.resync_message = resync_message or {"type": "resync", "data": {"reason": "slow_consumer"}}
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._wakeup = asyncio.Event()
+        self._disconnect = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def start(self) -> None:
+        """Start the writer task."""
+        self._task = asyncio.create_task(self._drain())
+
+    def enqueue(self, message: Dict[str, Any]) -> bool:
+        """
+        Queue a message without blocking. Applies the slow-consumer
+        policy when the queue is full. Returns False if the message was
+        not queued.
+        """
+        if self.closed or self._disconnect:
+            return False
+
+        if len(self._queue) >= self.max_size:
+            if self.policy == SlowConsumerPolicy.DISCONNECT:
+                self.dropped += len(self._queue) + 1
+                self._queue.clear()
+                self._disconnect = True
+                self._wakeup.set()
+                return False
+            if self.policy == SlowConsumerPolicy.COALESCE:
+                self.dropped += len(self._queue)
+                self._queue.clear()
+                self._queue.append(self.resync_message)
+            else:
+                self._queue.popleft()
+                self.dropped += 1
+
+        self._queue.append(message)
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._wakeup.set()
+        return True
+
+    async def close(self) -> None:
+        """Stop the writer task and drop anything still queued."""
+        self.closed = True
+        self._queue.clear()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+    async def _drain(self) -> None:
+        try:
+            while not self.closed:
+                if not self._queue and not self._disconnect:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                if self._disconnect:
+                    self.closed = True
+                    await self.websocket.close(code=1013)
+                    return
+                message = self._queue.popleft()
+                await self.websocket.send_json(message)
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Socket is gone; the receive loop will notice and clean up
+            self.closed = True
+            self._queue.clear()
+
+
+def queue_stats(outboxes: Iterable[ConnectionOutbox]) -> Dict[str, int]:
+    """Aggregate queue metrics across connections."""
+    outboxes = list(outboxes)
+    return {
+        "connections": len(outboxes),
+        "queued": sum(outbox.depth for outbox in outboxes),
+        "max_depth": max((outbox.max_depth for outbox in outboxes), default=0),
+        "sent": sum(outbox.sent for outbox in outboxes),
+        "dropped": sum(outbox.dropped for outbox in outboxes),
+    }
@@ -1,24 +1,70 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from typing import Dict, Set
+from .config import settings
+from .services.event_coalescer import EventCoalescer
+from .services.pubsub import bus
+from .services.ws_outbox import ConnectionOutbox, SlowConsumerPolicy, queue_stats
 
 router = APIRouter()
-rooms: Dict[str, Set[WebSocket]] = {}
+rooms: Dict[str, Set[ConnectionOutbox]] = {}
+
+RESYNC = {"event": "graph_changed", "payload": {"reason": "resync"}}
 
 @router.websocket("/ws")
 async def ws_endpoint(ws: WebSocket, project_id: str):
   await ws.accept()
+  outbox = ConnectionOutbox(
+    ws,
+    max_size=settings.WS_SEND_QUEUE_SIZE,
+    policy=SlowConsumerPolicy(settings.WS_SLOW_CONSUMER_POLICY),
+    resync_message=RESYNC,
+  )
+  outbox.start()
   room = rooms.setdefault(project_id, set())
-  room.add(ws)
+  room.add(outbox)
   try:
     while True:
       # we echo pings from client; server mainly broadcasts on change
       await ws.receive_text()
   except WebSocketDisconnect:
-    room.remove(ws)
+    pass
+  finally:
+    room.discard(outbox)
+    await outbox.close()
+
+def _fan_out(project_id: str, message: dict):
+  # enqueue only: each connection's writer task does the actual send
+  room = rooms.get(project_id)
+  if not room:
+    return
+  for outbox in list(room):
+    if outbox.closed:
+      room.discard(outbox)
+    else:
+      outbox.enqueue(message)
+
+# the bus hands messages from every worker to this worker's connections
+bus.subscribe("ws", _fan_out, RESYNC)
+
+async def _flush_graph_changed(project_id: str, payload: dict):
+  await bus.publish("ws", project_id, {"event": "graph_changed", "payload": payload})
+
+coalescer = EventCoalescer(settings.GRAPH_EVENT_COALESCE_MS, _flush_graph_changed)
 
 async def broadcast(project_id: str, event: str, payload: dict):
-  for ws in list(rooms.get(project_id, [])):
-    try:
-      await ws.send_json({"event": event, "payload": payload})
-    except Exception:
-      rooms[project_id].discard(ws)
+  if event != "graph_changed":
+    await bus.publish("ws", project_id, {"event": event, "payload": payload})
+    return
+  # graph_changed events within the coalescing window go out as one message
+  edge = (payload["source"], payload["target"]) if "source" in payload else None
+  await coalescer.add(
+    project_id,
+    payload.get("reason", "changed"),
+    nodes=[payload["node"]] if "node" in payload else [],
+    edges=[edge] if edge else [],
+    milestones=[payload["milestone"]] if "milestone" in payload else [],
+    replaced="diff" in payload,
+  )
+
+def ws_stats() -> dict:
+  return queue_stats(outbox for room in rooms.values() for outbox in room)
@@ -201,3 +201,56 @@ class TestValidateAction:
             "IN_PROGRESS"
         )
         assert not is_valid
+
+
+class TestContextIndex:
+    """Test the compiled (type, status) action index."""
+
+    def test_status_rules_include_type_wide_rules(self):
+        """Test that status-specific lookups also include type-wide rules."""
+        action_registry.register_context_rule(ContextRule(
+            id="index-test-wide",
+            node_types=["INDEX_TEST"],
+            actions=["view-details"],
+            priority=900
+        ))
+        action_registry.register_context_rule(ContextRule(
+            id="index-test-running",
+            node_types=["INDEX_TEST"],
+            node_statuses=["RUNNING"],
+            actions=["pause-resume"],
+            priority=901
+        ))
+
+        running_ids = [a.id for a in action_registry.get_actions_for_context("INDEX_TEST", "RUNNING")]
+        idle_ids = [a.id for a in action_registry.get_actions_for_context("INDEX_TEST", "IDLE")]
+
+        assert running_ids == ["view-details", "pause-resume"]
+        assert idle_ids == ["view-details"]
+
+    def test_unknown_context_returns_no_actions(self):
+        """Test that an unknown node type has no actions."""
+        assert action_registry.get_actions_for_context("NO_SUCH_TYPE") == []
+        assert not action_registry.validate_action("view-details", "NO_SUCH_TYPE")
+
+    def test_index_rebuilt_when_action_registered_late(self):
+        """Test that a rule referencing a not-yet-registered action picks it up."""
+        action_registry.register_context_rule(ContextRule(
+            id="late-action-rule",
+            node_types=["LATE_TEST"],
+            actions=["late-test-action"],
+            priority=902
+        ))
+        assert not action_registry.validate_action("late-test-action", "LATE_TEST")
+
+        action_registry.register_action(SiblingAction(
+            id="late-test-action",
+            label="Late",
+            icon="⏰",
+            type=ActionType.VIEW,
+            category=ActionCategory.FOUNDATIONAL,
+            handler="lateHandler"
+        ))
+
+        assert action_registry.validate_action("late-test-action", "LATE_TEST")
+        assert action_registry.get_action_ids_for_context("LATE_TEST") == frozenset({"late-test-action"})
@@ -126,6 +126,68 @@ class TestGetNodeActions:
         assert "Node not found" in response.json()["detail"]
 
 
+class TestBatchNodeActions:
+    """Test POST /api/projects/{pid}/nodes/actions/batch endpoint."""
+
+    def test_batch_actions_for_all_nodes(self, client, sample_project):
+        """Test resolving actions for every node in a project."""
+        client.db.add_all([
+            Node(id="batch-root", project_id=sample_project.id, label="Root",
+                 type="ROOT", status="IDLE"),
+            Node(id="batch-task-1", project_id=sample_project.id, label="Task 1",
+                 type="TASK", status="IN_PROGRESS"),
+            Node(id="batch-task-2", project_id=sample_project.id, label="Task 2",
+                 type="TASK", status="IN_PROGRESS"),
+        ])
+        client.db.commit()
+
+        response = client.post(
+            f"/api/projects/{sample_project.id}/nodes/actions/batch",
+            json={}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["nodes"] == {
+            "batch-root": "ROOT:IDLE",
+            "batch-task-1": "TASK:IN_PROGRESS",
+            "batch-task-2": "TASK:IN_PROGRESS",
+        }
+        # Identical contexts are resolved once
+        assert len(data["contexts"]) == 2
+        assert "view-timeline" in data["contexts"]["ROOT:IDLE"]
+        assert "mark-complete" in data["contexts"]["TASK:IN_PROGRESS"]
+
+    def test_batch_actions_for_selected_nodes(self, client, sample_project):
+        """Test resolving actions for a chosen list of node IDs."""
+        client.db.add_all([
+            Node(id="selected-file", project_id=sample_project.id, label="main.py",
+                 type="FILE", status="IDLE"),
+            Node(id="unselected-task", project_id=sample_project.id, label="Task",
+                 type="TASK", status="IDLE"),
+        ])
+        client.db.commit()
+
+        response = client.post(
+            f"/api/projects/{sample_project.id}/nodes/actions/batch",
+            json={"node_ids": ["selected-file", "nonexistent"]}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["nodes"]) == ["selected-file"]
+        assert "refactor-code" in data["contexts"]["FILE:IDLE"]
+        assert data["missing"] == ["nonexistent"]
+
+    def test_batch_actions_nonexistent_project(self, client):
+        """Test batch resolution for non-existent project."""
+        response = client.post(
+            "/api/projects/nonexistent/nodes/actions/batch",
+            json={}
+        )
+        assert response.status_code == 404
+
+
 class TestExpandGroupActions:
     """Test GET /api/projects/{pid}/nodes/{nid}/actions/{group_id}/expand."""
 
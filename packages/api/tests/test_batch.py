@@ -0,0 +1,106 @@
+"""Tests for the batch mutation endpoint."""
+import pytest
+from app.models import Node, Edge
+
+
+class TestApplyBatch:
+    def test_batch_create_patch_delete(self, client, sample_edge):
+        """Test applying mixed operations in one request."""
+        project_id = sample_edge["edge"].project_id
+        node1, node2 = sample_edge["node1"], sample_edge["node2"]
+
+        response = client.post(
+            f"/api/projects/{project_id}/batch",
+            json={
+                "operations": [
+                    {"op": "create", "entity": "node", "id": "batch-new",
+                     "data": {"label": "New", "type": "TASK", "tags": ["x"]}},
+                    {"op": "create", "entity": "edge",
+                     "data": {"source": "batch-new", "target": node2.id, "type": "dependency"}},
+                    {"op": "patch", "entity": "node", "id": node2.id,
+                     "data": {"status": "BLOCKED"}},
+                    {"op": "delete", "entity": "edge", "id": sample_edge["edge"].id},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["revision"] == 1
+        assert [r["status"] for r in data["results"]] == ["ok"] * 4
+        assert data["results"][0]["id"] == "batch-new"
+
+        client.db.expire_all()
+        assert client.db.get(Node, "batch-new").metadata["tags"] == ["x"]
+        assert client.db.get(Node, node2.id).status == "BLOCKED"
+        assert client.db.get(Edge, sample_edge["edge"].id) is None
+
+    def test_batch_is_atomic(self, client, sample_node):
+        """Test that a failing operation rolls back the whole batch."""
+        project_id = sample_node.project_id
+
+        response = client.post(
+            f"/api/projects/{project_id}/batch",
+            json={
+                "operations": [
+                    {"op": "patch", "entity": "node", "id": sample_node.id,
+                     "data": {"status": "COMPLETED"}},
+                    {"op": "delete", "entity": "node", "id": "nonexistent"},
+                    {"op": "patch", "entity": "node", "id": sample_node.id,
+                     "data": {"progress": 10}},
+                ]
+            },
+        )
+
+        assert response.status_code == 422
+        results = response.json()["detail"]["results"]
+        assert [r["status"] for r in results] == ["ok", "error", "skipped"]
+        assert results[1]["error"] == "Node not found"
+
+        client.db.expire_all()
+        assert client.db.get(Node, sample_node.id).status == "IDLE"
+
+    def test_batch_invalid_data(self, client, sample_node):
+        """Test that schema validation errors are reported per operation."""
+        response = client.post(
+            f"/api/projects/{sample_node.project_id}/batch",
+            json={
+                "operations": [
+                    {"op": "patch", "entity": "node", "id": sample_node.id,
+                     "data": {"progress": 500}},
+                ]
+            },
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"]["results"][0]["status"] == "error"
+
+    def test_batch_broadcasts_single_event(self, client, sample_node):
+        """Test that one websocket event is sent for the whole batch."""
+        project_id = sample_node.project_id
+
+        with client.websocket_connect(f"/ws?project_id={project_id}") as ws:
+            client.post(
+                f"/api/projects/{project_id}/batch",
+                json={
+                    "operations": [
+                        {"op": "patch", "entity": "node", "id": sample_node.id,
+                         "data": {"progress": 10}},
+                        {"op": "patch", "entity": "node", "id": sample_node.id,
+                         "data": {"progress": 20}},
+                    ]
+                },
+            )
+            message = ws.receive_json()
+
+        assert message["type"] == "graph_changed"
+        assert message["data"]["reason"] == "batch"
+        assert message["data"]["nodes"] == [sample_node.id]
+
+    def test_batch_nonexistent_project(self, client):
+        """Test batch against a project that doesn't exist."""
+        response = client.post(
+            "/api/projects/nonexistent/batch",
+            json={"operations": [{"op": "delete", "entity": "node", "id": "x"}]},
+        )
+        assert response.status_code == 404
@@ -0,0 +1,95 @@
+"""Tests for graph_changed event coalescing."""
+import asyncio
+import pytest
+from app.services.event_coalescer import EventCoalescer
+
+
+class Recorder:
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, project_id, payload):
+        self.messages.append((project_id, payload))
+
+
+class TestEventCoalescer:
+    async def test_events_in_window_are_merged(self):
+        """Test that a burst of events produces one message."""
+        recorder = Recorder()
+        coalescer = EventCoalescer(20, recorder)
+
+        await coalescer.add("p1", "node_added", nodes=["a"])
+        await coalescer.add("p1", "node_updated", nodes=["a", "b"])
+        await coalescer.add("p1", "edge_added", edges=[("a", "b")])
+        await coalescer.add("p1", "milestone_added", milestones=["m1"])
+        assert recorder.messages == []
+
+        await asyncio.sleep(0.05)
+
+        assert len(recorder.messages) == 1
+        project_id, payload = recorder.messages[0]
+        assert project_id == "p1"
+        assert payload["reason"] == "coalesced"
+        assert payload["events"] == 4
+        assert payload["nodes"] == ["a", "b"]
+        assert payload["edges"] == [["a", "b"]]
+        assert payload["milestones"] == ["m1"]
+        assert payload["replaced"] is False
+
+    async def test_single_event_keeps_reason(self):
+        """Test that a lone event keeps its own reason."""
+        recorder = Recorder()
+        coalescer = EventCoalescer(10, recorder)
+
+        await coalescer.add("p1", "node_removed", nodes=["a"])
+        await asyncio.sleep(0.03)
+
+        assert recorder.messages[0][1]["reason"] == "node_removed"
+        assert recorder.messages[0][1]["reasons"] == ["node_removed"]
+
+    async def test_projects_are_independent(self):
+        """Test that each project has its own window."""
+        recorder = Recorder()
+        coalescer = EventCoalescer(10, recorder)
+
+        await coalescer.add("p1", "node_added", nodes=["a"])
+        await coalescer.add("p2", "node_added", nodes=["b"])
+        await asyncio.sleep(0.03)
+
+        by_project = {pid: payload for pid, payload in recorder.messages}
+        assert by_project["p1"]["nodes"] == ["a"]
+        assert by_project["p2"]["nodes"] == ["b"]
+
+    async def test_new_window_after_flush(self):
+        """Test that events after a flush open a new window."""
+        recorder = Recorder()
+        coalescer = EventCoalescer(10, recorder)
+
+        await coalescer.add("p1", "node_added", nodes=["a"])
+        await asyncio.sleep(0.03)
+        await coalescer.add("p1", "node_added", nodes=["b"])
+        await asyncio.sleep(0.03)
+
+        assert [payload["nodes"] for _, payload in recorder.messages] == [["a"], ["b"]]
+
+    async def test_zero_window_sends_immediately(self):
+        """Test that coalescing is disabled with a zero window."""
+        recorder = Recorder()
+        coalescer = EventCoalescer(0, recorder)
+
+        await coalescer.add("p1", "replace", replaced=True)
+
+        assert len(recorder.messages) == 1
+        assert recorder.messages[0][1]["replaced"] is True
+
+    async def test_flush_all(self):
+        """Test that pending events can be flushed explicitly."""
+        recorder = Recorder()
+        coalescer = EventCoalescer(10_000, recorder)
+
+        await coalescer.add("p1", "node_added", nodes=["a"])
+        await coalescer.add("p2", "node_added", nodes=["b"])
+        await coalescer.flush_all()
+
+        assert len(recorder.messages) == 2
+        assert coalescer.pending("p1") is None
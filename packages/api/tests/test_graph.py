@@ -47,4 +47,186 @@ class TestGetGraph:
             assert "id" in edge
             assert "source" in edge
             assert "target" in edge
-            assert "type" in edge
\ No newline at end of file
+            assert "type" in edge
+
+class TestGraphCacheInvalidation:
+    def test_graph_reflects_node_updated_after_read(self, client, sample_node):
+        """Test that updating a node invalidates the cached graph."""
+        url = f"/api/projects/{sample_node.project_id}/graph"
+        assert client.get(url).json()["nodes"][0]["status"] == "IDLE"
+
+        client.patch(
+            f"/api/projects/{sample_node.project_id}/nodes/{sample_node.id}",
+            json={"status": "IN_PROGRESS"},
+        )
+
+        assert client.get(url).json()["nodes"][0]["status"] == "IN_PROGRESS"
+
+    def test_graph_reflects_node_deleted_after_read(self, client, sample_node):
+        """Test that deleting a node invalidates the cached graph."""
+        url = f"/api/projects/{sample_node.project_id}/graph"
+        assert len(client.get(url).json()["nodes"]) == 1
+
+        client.delete(f"/api/projects/{sample_node.project_id}/nodes/{sample_node.id}")
+
+        assert client.get(url).json()["nodes"] == []
+
+
+class TestConditionalGraphGet:
+    def test_graph_has_validators(self, client, sample_project):
+        """Test that the graph response carries ETag and Last-Modified."""
+        response = client.get(f"/api/projects/{sample_project.id}/graph")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"0-graph"'
+        assert "last-modified" in response.headers
+
+    def test_graph_not_modified(self, client, sample_project):
+        """Test that a matching If-None-Match returns 304."""
+        url = f"/api/projects/{sample_project.id}/graph"
+        etag = client.get(url).headers["etag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_graph_etag_changes_after_write(self, client, sample_node):
+        """Test that a write bumps the revision and the ETag."""
+        url = f"/api/projects/{sample_node.project_id}/graph"
+        etag = client.get(url).headers["etag"]
+
+        client.patch(
+            f"/api/projects/{sample_node.project_id}/nodes/{sample_node.id}",
+            json={"progress": 40},
+        )
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["nodes"][0]["progress"] == 40
+
+
+class TestGraphChanges:
+    def test_changes_since_includes_updated_node(self, client, sample_node):
+        """Test that an updated node is returned as upserted."""
+        project_id = sample_node.project_id
+        client.patch(
+            f"/api/projects/{project_id}/nodes/{sample_node.id}",
+            json={"status": "BLOCKED"},
+        )
+
+        response = client.get(f"/api/projects/{project_id}/graph/changes?since=0")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["revision"] == 1
+        assert data["reset"] is False
+        assert [n["id"] for n in data["nodes"]["upserted"]] == [sample_node.id]
+        assert data["nodes"]["upserted"][0]["status"] == "BLOCKED"
+        assert data["nodes"]["deleted"] == []
+
+    def test_changes_since_includes_deleted_node(self, client, sample_node):
+        """Test that a deleted node is returned by ID."""
+        project_id = sample_node.project_id
+        client.delete(f"/api/projects/{project_id}/nodes/{sample_node.id}")
+
+        data = client.get(f"/api/projects/{project_id}/graph/changes?since=0").json()
+
+        assert data["nodes"]["upserted"] == []
+        assert data["nodes"]["deleted"] == [sample_node.id]
+
+    def test_changes_only_after_revision(self, client, sample_node):
+        """Test that changes at or before `since` are not returned."""
+        project_id = sample_node.project_id
+        url = f"/api/projects/{project_id}/nodes/{sample_node.id}"
+        client.patch(url, json={"progress": 10})
+
+        data = client.get(f"/api/projects/{project_id}/graph/changes?since=1").json()
+
+        assert data["revision"] == 1
+        assert data["nodes"]["upserted"] == []
+
+    def test_edge_created_and_deleted_in_window_is_omitted(self, client, sample_edge):
+        """Test that an entity created and removed after `since` is not reported."""
+        project_id = sample_edge["edge"].project_id
+        created = client.post(
+            f"/api/projects/{project_id}/edges",
+            json={
+                "source": sample_edge["node1"].id,
+                "target": sample_edge["node2"].id,
+                "type": "reference",
+            },
+        ).json()
+        client.delete(f"/api/projects/{project_id}/edges/{created['id']}")
+
+        data = client.get(f"/api/projects/{project_id}/graph/changes?since=0").json()
+
+        assert data["revision"] == 2
+        assert data["edges"] == {"upserted": [], "deleted": []}
+
+    def test_compacted_revision_requires_reset(self, client, test_db, sample_node):
+        """Test that a compacted revision tells the client to reload."""
+        from app.services.change_log import compact_changes
+
+        project_id = sample_node.project_id
+        url = f"/api/projects/{project_id}/nodes/{sample_node.id}"
+        client.patch(url, json={"progress": 10})
+        client.patch(url, json={"progress": 20})
+        compact_changes(test_db, project_id, 1)
+        test_db.commit()
+
+        stale = client.get(f"/api/projects/{project_id}/graph/changes?since=0").json()
+        fresh = client.get(f"/api/projects/{project_id}/graph/changes?since=1").json()
+
+        assert stale["reset"] is True
+        assert stale["revision"] == 2
+        assert fresh["reset"] is False
+        assert [n["progress"] for n in fresh["nodes"]["upserted"]] == [20]
+
+    def test_changes_nonexistent_project(self, client):
+        """Test delta sync for a project that doesn't exist."""
+        response = client.get("/api/projects/nonexistent/graph/changes?since=0")
+        assert response.status_code == 404
+
+
+class TestBulkImport:
+    def test_bulk_import_nodes_and_edges(self, client, sample_project):
+        """Test importing nodes and edges in small batches."""
+        nodes = [
+            {"id": f"bulk-{i}", "label": f"Node {i}", "type": "TASK", "dependencies": ["x"]}
+            for i in range(7)
+        ]
+        edges = [
+            {"source": f"bulk-{i}", "target": f"bulk-{i + 1}", "type": "dependency"}
+            for i in range(6)
+        ]
+
+        response = client.post(
+            f"/api/projects/{sample_project.id}/graph:bulk",
+            json={"nodes": nodes, "edges": edges, "batch_size": 3},
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {"nodes": 7, "edges": 6, "revision": 1}
+
+        graph = client.get(f"/api/projects/{sample_project.id}/graph").json()
+        assert len(graph["nodes"]) == 7
+        assert len(graph["edges"]) == 6
+        assert graph["nodes"][0]["status"] == "IDLE"
+
+    def test_bulk_import_resets_delta_sync(self, client, sample_project):
+        """Test that delta clients are told to reload after a bulk import."""
+        client.post(
+            f"/api/projects/{sample_project.id}/graph:bulk",
+            json={"nodes": [{"label": "Only", "type": "NOTE"}]},
+        )
+
+        data = client.get(f"/api/projects/{sample_project.id}/graph/changes?since=0").json()
+        assert data["reset"] is True
+
+    def test_bulk_import_nonexistent_project(self, client):
+        """Test bulk import into a project that doesn't exist."""
+        response = client.post("/api/projects/nonexistent/graph:bulk", json={"nodes": []})
+        assert response.status_code == 404
@@ -0,0 +1,64 @@
+"""Tests for the in-process graph cache."""
+import pytest
+from app.services.graph_cache import GraphCache
+
+
+class TestGraphCache:
+    def test_get_miss_then_hit(self):
+        """Test that a stored payload is returned and counted as a hit."""
+        cache = GraphCache(max_bytes=1024)
+
+        assert cache.get("p1", "graph") is None
+        cache.put("p1", "graph", b'{"nodes": []}')
+
+        assert cache.get("p1", "graph") == b'{"nodes": []}'
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["bytes"] == len(b'{"nodes": []}')
+
+    def test_invalidate_drops_all_views(self):
+        """Test that invalidating a project drops every cached view."""
+        cache = GraphCache(max_bytes=1024)
+        cache.put("p1", "graph", b"a")
+        cache.put("p1", "legacy", b"b")
+        cache.put("p2", "graph", b"c")
+
+        cache.invalidate("p1")
+
+        assert cache.get("p1", "graph") is None
+        assert cache.get("p1", "legacy") is None
+        assert cache.get("p2", "graph") == b"c"
+        assert cache.stats()["invalidations"] == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that the budget is enforced by evicting the LRU entry."""
+        cache = GraphCache(max_bytes=10)
+        cache.put("p1", "graph", b"1234")
+        cache.put("p2", "graph", b"1234")
+        cache.get("p1", "graph")  # p2 is now least recently used
+        cache.put("p3", "graph", b"1234")
+
+        assert cache.get("p2", "graph") is None
+        assert cache.get("p1", "graph") == b"1234"
+        assert cache.get("p3", "graph") == b"1234"
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 8
+
+    def test_replacing_entry_updates_size(self):
+        """Test that re-putting a key does not double count its size."""
+        cache = GraphCache(max_bytes=100)
+        cache.put("p1", "graph", b"12345")
+        cache.put("p1", "graph", b"12")
+
+        assert cache.stats()["bytes"] == 2
+        assert cache.stats()["entries"] == 1
+
+    def test_oversized_payload_not_cached(self):
+        """Test that a payload larger than the budget is skipped."""
+        cache = GraphCache(max_bytes=4)
+        cache.put("p1", "graph", b"12345")
+
+        assert cache.get("p1", "graph") is None
+        assert cache.stats()["entries"] == 0
@@ -2,6 +2,18 @@
 import pytest
 
 
+class TestListNodes:
+    def test_list_nodes_not_modified(self, client, sample_node):
+        """Test conditional GET on the node list."""
+        url = f"/api/projects/{sample_node.project_id}/nodes"
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["etag"].endswith('-nodes"')
+
+        response = client.get(url, headers={"If-None-Match": response.headers["etag"]})
+        assert response.status_code == 304
+
+
 class TestCreateNode:
     def test_create_node(self, client, sample_project):
         """Test creating a node."""
@@ -92,4 +104,56 @@ class TestDeleteNode:
         """Test deleting a node that doesn't exist."""
         response = client.delete(f"/api/projects/{sample_project.id}/nodes/nonexistent")
 
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+class TestNodeEvents:
+    def test_update_sends_hint(self, client, sample_node):
+        """Test that hint subscribers get touched IDs and the revision."""
+        project_id = sample_node.project_id
+        with client.websocket_connect(f"/ws?project_id={project_id}") as ws:
+            response = client.patch(
+                f"/api/projects/{project_id}/nodes/{sample_node.id}",
+                json={"status": "DONE"},
+            )
+            message = ws.receive_json()
+
+        assert message["type"] == "graph_changed"
+        assert message["data"]["reason"] == "node_updated"
+        assert message["data"]["nodes"] == [sample_node.id]
+        assert message["data"]["revision"] > 0
+        assert "patch" not in message
+        assert response.status_code == 200
+
+    def test_update_sends_patch_to_payload_subscribers(self, client, sample_node):
+        """Test that payload subscribers get the changed node."""
+        project_id = sample_node.project_id
+        with client.websocket_connect(f"/ws?project_id={project_id}&mode=payload") as ws:
+            client.patch(
+                f"/api/projects/{project_id}/nodes/{sample_node.id}",
+                json={"progress": 40},
+            )
+            message = ws.receive_json()
+
+        assert message["type"] == "graph_patch"
+        patch = message["data"]
+        assert patch["since"] == patch["revision"] - 1
+        assert [node["id"] for node in patch["nodes"]["upserted"]] == [sample_node.id]
+        assert patch["nodes"]["upserted"][0]["progress"] == 40
+
+    def test_delete_sends_patch(self, client, sample_node):
+        """Test that deletions are listed in the patch."""
+        project_id = sample_node.project_id
+        with client.websocket_connect(f"/ws?project_id={project_id}&mode=payload") as ws:
+            client.delete(f"/api/projects/{project_id}/nodes/{sample_node.id}")
+            message = ws.receive_json()
+
+        assert message["data"]["nodes"]["deleted"] == [sample_node.id]
+        assert message["data"]["nodes"]["upserted"] == []
+
+    def test_unknown_mode_is_rejected(self, client, sample_node):
+        """Test that an unknown subscription mode closes the socket."""
+        from starlette.websockets import WebSocketDisconnect
+
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect(f"/ws?project_id={sample_node.project_id}&mode=full") as ws:
+                ws.receive_json()
@@ -0,0 +1,123 @@
+"""Tests for the cross-worker broadcast bus."""
+import asyncio
+import importlib.util
+import pytest
+from app.services.pubsub import MemoryBus, PostgresBus, UnixSocketBus, _postgres_dsn
+
+RESYNC = {"type": "resync"}
+
+
+class Inbox:
+    def __init__(self):
+        self.messages = []
+
+    def __call__(self, project_id, message):
+        self.messages.append((project_id, message))
+
+
+def make_bus(bus):
+    inbox = Inbox()
+    bus.subscribe("api", inbox, RESYNC)
+    return bus, inbox
+
+
+async def wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestMemoryBus:
+    async def test_publish_delivers_locally(self):
+        """Test that the in-process bus delivers to the local handler."""
+        bus, inbox = make_bus(MemoryBus())
+        await bus.start()
+
+        await bus.publish("api", "p1", {"type": "graph_changed"})
+
+        assert inbox.messages == [("p1", {"type": "graph_changed"})]
+
+    async def test_unknown_topic_is_ignored(self):
+        """Test that topics without a handler are dropped."""
+        bus, inbox = make_bus(MemoryBus())
+        await bus.publish("ws", "p1", {"event": "graph_changed"})
+        assert inbox.messages == []
+
+
+class TestUnixSocketBus:
+    async def test_relays_between_workers(self, tmp_path):
+        """Test that a message reaches the other worker exactly once."""
+        path = str(tmp_path / "bus.sock")
+        worker_a, inbox_a = make_bus(UnixSocketBus(path))
+        worker_b, inbox_b = make_bus(UnixSocketBus(path))
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            await worker_a.publish("api", "p1", {"n": 1})
+            await worker_b.publish("api", "p1", {"n": 2})
+            await wait_for(lambda: len(inbox_a.messages) == 2 and len(inbox_b.messages) == 2)
+            await asyncio.sleep(0.05)
+
+            assert inbox_a.messages == [("p1", {"n": 1}), ("p1", {"n": 2})]
+            assert inbox_b.messages == [("p1", {"n": 2}), ("p1", {"n": 1})]
+        finally:
+            await worker_b.stop()
+            await worker_a.stop()
+
+    async def test_oversized_message_becomes_resync(self, tmp_path):
+        """Test that messages over the relay limit arrive as a resync."""
+
+        class SmallBus(UnixSocketBus):
+            max_payload_bytes = 64
+
+        path = str(tmp_path / "bus.sock")
+        worker_a, _ = make_bus(SmallBus(path))
+        worker_b, inbox_b = make_bus(SmallBus(path))
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            await worker_a.publish("api", "p1", {"nodes": ["x" * 100]})
+            await wait_for(lambda: inbox_b.messages)
+            assert inbox_b.messages == [("p1", RESYNC)]
+        finally:
+            await worker_b.stop()
+            await worker_a.stop()
+
+    async def test_survivor_takes_over_broker(self, tmp_path):
+        """Test that workers keep relaying after the broker stops."""
+        path = str(tmp_path / "bus.sock")
+        broker, _ = make_bus(UnixSocketBus(path))
+        worker_b, inbox_b = make_bus(UnixSocketBus(path))
+        worker_c, inbox_c = make_bus(UnixSocketBus(path))
+        for bus in (broker, worker_b, worker_c):
+            await bus.start()
+        try:
+            await broker.stop()
+
+            async def relayed():
+                await worker_b.publish("api", "p1", {"n": 1})
+                return any(m == ("p1", {"n": 1}) for m in inbox_c.messages)
+
+            deadline = asyncio.get_running_loop().time() + 5
+            while not await relayed():
+                assert asyncio.get_running_loop().time() < deadline
+                await asyncio.sleep(0.1)
+        finally:
+            await worker_c.stop()
+            await worker_b.stop()
+
+
+class TestPostgresBus:
+    def test_dsn_strips_driver(self):
+        """Test that SQLAlchemy URLs are turned into libpq URLs."""
+        assert _postgres_dsn("postgresql+psycopg2://u:p@db/vislzr") == "postgresql://u:p@db/vislzr"
+        assert _postgres_dsn("postgresql://u@db/vislzr") == "postgresql://u@db/vislzr"
+
+    @pytest.mark.skipif(importlib.util.find_spec("asyncpg") is not None, reason="asyncpg installed")
+    async def test_start_requires_asyncpg(self):
+        """Test that a missing driver is reported clearly."""
+        bus = PostgresBus("postgresql://localhost/vislzr", "vislzr_broadcast")
+        with pytest.raises(RuntimeError):
+            await bus.start()
@@ -0,0 +1,121 @@
+"""Tests for per-connection websocket send queues."""
+import asyncio
+import pytest
+from app.services.ws_outbox import ConnectionOutbox, SlowConsumerPolicy, queue_stats
+
+
+class FakeWebSocket:
+    """Websocket stub whose sends block until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed_with = None
+        self.release = asyncio.Event()
+
+    async def send_json(self, message):
+        await self.release.wait()
+        self.sent.append(message)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionOutbox:
+    async def test_messages_delivered_in_order(self):
+        """Test that queued messages are sent by the writer task in order."""
+        ws = FakeWebSocket()
+        ws.release.set()
+        outbox = ConnectionOutbox(ws, max_size=10, policy=SlowConsumerPolicy.DROP_OLDEST)
+        outbox.start()
+
+        for i in range(3):
+            assert outbox.enqueue({"n": i})
+        await settle()
+
+        assert ws.sent == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert outbox.stats()["sent"] == 3
+        await outbox.close()
+
+    async def test_enqueue_does_not_wait_for_slow_socket(self):
+        """Test that a blocked socket does not block enqueue."""
+        ws = FakeWebSocket()
+        outbox = ConnectionOutbox(ws, max_size=10, policy=SlowConsumerPolicy.DROP_OLDEST)
+        outbox.start()
+
+        for i in range(5):
+            outbox.enqueue({"n": i})
+        await settle()
+
+        assert ws.sent == []
+        assert outbox.depth == 4  # one message is in flight
+        await outbox.close()
+
+    async def test_drop_oldest_policy(self):
+        """Test that the oldest message is dropped when full."""
+        ws = FakeWebSocket()
+        outbox = ConnectionOutbox(ws, max_size=2, policy=SlowConsumerPolicy.DROP_OLDEST)
+
+        for i in range(4):
+            outbox.enqueue({"n": i})
+
+        assert outbox.dropped == 2
+        outbox.start()
+        ws.release.set()
+        await settle()
+        assert ws.sent == [{"n": 2}, {"n": 3}]
+        await outbox.close()
+
+    async def test_coalesce_policy(self):
+        """Test that a full queue collapses into a resync message."""
+        ws = FakeWebSocket()
+        outbox = ConnectionOutbox(
+            ws, max_size=2, policy=SlowConsumerPolicy.COALESCE,
+            resync_message={"type": "resync"}
+        )
+
+        for i in range(3):
+            outbox.enqueue({"n": i})
+
+        outbox.start()
+        ws.release.set()
+        await settle()
+        assert ws.sent == [{"type": "resync"}, {"n": 2}]
+        assert outbox.dropped == 2
+        await outbox.close()
+
+    async def test_disconnect_policy(self):
+        """Test that a full queue closes the connection."""
+        ws = FakeWebSocket()
+        outbox = ConnectionOutbox(ws, max_size=1, policy=SlowConsumerPolicy.DISCONNECT)
+        outbox.start()
+
+        outbox.enqueue({"n": 0})
+        await settle()  # first message is now in flight
+        outbox.enqueue({"n": 1})
+        assert not outbox.enqueue({"n": 2})
+        ws.release.set()
+        await settle()
+
+        assert ws.closed_with == 1013
+        assert outbox.closed
+        assert not outbox.enqueue({"n": 3})
+
+    async def test_queue_stats(self):
+        """Test aggregate queue metrics."""
+        outboxes = [
+            ConnectionOutbox(FakeWebSocket(), max_size=5, policy=SlowConsumerPolicy.DROP_OLDEST)
+            for _ in range(2)
+        ]
+        outboxes[0].enqueue({"n": 0})
+        outboxes[1].enqueue({"n": 0})
+        outboxes[1].enqueue({"n": 1})
+
+        stats = queue_stats(outboxes)
+        assert stats["connections"] == 2
+        assert stats["queued"] == 3
+        assert stats["max_depth"] == 2